@@ -6,17 +6,36 @@ Tests accuracy against ground truth labels in diverse_synthetic_articles.csv
 import os
 import csv
 import time
+import asyncio
+import threading
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
-from src.config import MLFLOW_TRACKING_URI, MLFLOW_EXPERIMENT_NAME
-from src.graph import build_graph
+from src.config import MLFLOW_TRACKING_URI, MLFLOW_EXPERIMENT_NAME, MAX_CONCURRENT_CASES, FAST_IO
+from src.graph import build_graph, INITIAL_STATE_DEFAULTS, release_article_context, size_node_executor, warm_up_llm
 from src.utils import setup_logger
 
 # Setup logger
 logger = setup_logger(name="EvaluationScript", log_level="INFO")
 
+# Columns of the detailed results CSV (one row written per completed case)
+RESULT_COLUMNS = [
+    'case_number', 'person_name', 'dob', 'scenario', 'language', 'article_title',
+    'ground_truth_match', 'predicted_match', 'match_correct',
+    'ground_truth_sentiment', 'predicted_sentiment', 'sentiment_correct',
+    'match_decision_raw', 'match_explanation', 'sentiment_raw', 'sentiment_explanation',
+    'name_is_present', 'age_matches', 'llm_calls_made', 'llm_calls_skipped',
+    'tokens_used', 'execution_time_seconds', 'status'
+]
+
+# Raw match decisions that count as a match (lowercased)
+MATCH_DECISIONS = frozenset({"match"})
+
+# Banner line framing sections of the console and text report
+SEPARATOR = "=" * 80
+
 
 def normalize_sentiment(sentiment) -> str:
     """Normalize sentiment labels for comparison."""
@@ -34,103 +53,121 @@ def normalize_sentiment(sentiment) -> str:
     return sentiment_lower
 
 
-def normalize_match_decision(decision: str, name_present: bool) -> str:
+def load_dataset(dataset_path: str) -> pd.DataFrame:
     """
-    Normalize match decision to binary match/non-match.
+    Load the evaluation dataset.
+
+    With FAST_IO enabled, the pyarrow parser is used and string columns are
+    Arrow-backed, which loads faster and keeps the long article_text column
+    compact in memory. Falls back to the default parser if pyarrow is missing.
 
     Args:
-        decision: The match decision from the system
-        name_present: Whether the name was found in the article
+        dataset_path: Path to the evaluation CSV
 
     Returns:
-        "match" or "non-match"
+        DataFrame with the evaluation cases
     """
-    if not decision:
-        return "non-match"
+    if FAST_IO:
+        try:
+            import pyarrow  # noqa: F401
+            # Keep dob as text so prompts see the same value as with the default parser
+            return pd.read_csv(dataset_path, engine='pyarrow', dtype_backend='pyarrow',
+                               dtype={'dob': 'string[pyarrow]'})
+        except ImportError:
+            logger.warning("FAST_IO is enabled but pyarrow is not installed. Using the default CSV parser.")
 
-    decision_lower = decision.lower().strip()
+    return pd.read_csv(dataset_path)
 
-    # If name not present, it's always a non-match
-    if not name_present:
-        return "non-match"
 
-    # "Match" is a match
-    if decision_lower == "match":
-        return "match"
+def add_ground_truth_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Precompute normalized ground truth labels for every row in one vectorized pass.
 
-    # Everything else (Non-Match, Review Required, Age Mismatch) is non-match
-    return "non-match"
+    Produces the same labels as normalize_sentiment and the match/non-match mapping,
+    which stay in use for the per-case LLM predictions.
 
+    Args:
+        df: Evaluation dataset with is_match and sentiment_label columns
 
-def run_evaluation():
-    """Run evaluation on diverse synthetic articles dataset."""
+    Returns:
+        The same DataFrame with gt_match and gt_sentiment columns added
+    """
+    df['gt_match'] = np.where(df['is_match'].astype(bool), 'match', 'non-match')
+    df['gt_sentiment'] = (
+        df['sentiment_label'].fillna('').astype(str).str.lower().str.strip()
+        .replace({'n/a': 'neutral', 'nan': 'neutral', '': 'neutral'})
+    )
+    return df
 
-    logger.info("=" * 80)
-    logger.info("ARTICLE PERSON VERIFICATION - ACCURACY EVALUATION")
-    logger.info("=" * 80)
 
-    # Load ground truth dataset
-    dataset_path = "diverse_synthetic_articles.csv"
-    if not os.path.exists(dataset_path):
-        logger.error(f"Dataset not found: {dataset_path}")
-        return
+def normalize_match_decision(decision: str, name_present: bool) -> str:
+    """
+    Normalize match decision to binary match/non-match.
 
-    df = pd.read_csv(dataset_path)
-    logger.info(f"Loaded {len(df)} test cases from {dataset_path}")
-    logger.info(f"Columns: {', '.join(df.columns.tolist())}")
+    Args:
+        decision: The match decision from the system
+        name_present: Whether the name was found in the article
 
-    # Build graph
-    logger.info("Building LangGraph workflow...")
-    app = build_graph()
-    logger.info("Graph compiled successfully")
+    Returns:
+        "match" or "non-match"
+    """
+    # Only an explicit "Match" with the name present counts; Non-Match, Review Required
+    # and Age Mismatch are all non-match
+    if name_present and decision and decision.strip().lower() in MATCH_DECISIONS:
+        return "match"
+    return "non-match"
 
-    # Prepare results storage
-    results = []
-    match_correct = 0
-    match_total = 0
-    sentiment_correct = 0
-    sentiment_total = 0
 
-    llm_calls_saved = 0
-    total_tokens = 0
-    total_execution_time = 0
+def record_result(writer: csv.DictWriter, results_file, **values) -> None:
+    """
+    Write one case's result row and flush it to disk.
 
-    logger.info(f"\nStarting evaluation on {len(df)} cases...")
-    logger.info("=" * 80)
+    Flushing per case keeps partial results on disk if the run is interrupted.
 
-    for idx, row in df.iterrows():
-        case_num = idx + 1
-        logger.info(f"\n[{case_num}/{len(df)}] Processing: {row['person_name']}")
+    Args:
+        writer: DictWriter over the detailed results CSV
+        results_file: File object the writer writes to
+        **values: One value per column in RESULT_COLUMNS
+    """
+    writer.writerow(values)
+    results_file.flush()
+
+
+async def evaluate_case(app, row, case_num: int, total_cases: int, semaphore: asyncio.Semaphore,
+                        writer: csv.DictWriter, results_file) -> None:
+    """
+    Run the verification graph for a single evaluation row and record its result.
+
+    Args:
+        app: Compiled LangGraph workflow
+        row: Dataset row (dict) with person_name, dob, article_text and ground truth labels
+        case_num: 1-based case number (used for logging and result ordering)
+        total_cases: Total number of cases in the evaluation
+        semaphore: Bounds how many cases run against the LLM at the same time
+        writer: DictWriter over the detailed results CSV
+        results_file: File object the writer writes to
+    """
+    async with semaphore:
+        logger.info(f"\n[{case_num}/{total_cases}] Processing: {row['person_name']}")
         logger.info(f"  Scenario: {row['scenario']} | Language: {row['language']}")
         logger.info(f"  Ground Truth: Match={row['is_match']}, Sentiment={row['sentiment_label']}")
 
         # Prepare input
         initial_state = {
+            **INITIAL_STATE_DEFAULTS,
             "applicant_name": row['person_name'],
             "applicant_dob": row['dob'],
-            "article_url": row['article_text'],  # Using article_text directly
-            "article_text": "",
-            "name_is_present": False,
-            "name_check_explanation": "",
-            "age_matches": False,
-            "age_check_explanation": "",
-            "match_decision": "Review Required",
-            "match_explanation": "",
-            "sentiment": "N/A",
-            "sentiment_explanation": "",
-            "token_usage": {}
+            "article_url": row['article_text']  # Using article_text directly
         }
 
         # Execute verification
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             final_state = None
-            for chunk in app.stream(initial_state):
-                if chunk:
-                    node_name, node_output = list(chunk.items())[0]
-                    initial_state.update(node_output)
-            final_state = initial_state
-            execution_time = time.time() - start_time
+            # The final "values" chunk is the merged state after the last step
+            async for final_state in app.astream(initial_state, stream_mode="values"):
+                pass
+            execution_time = time.perf_counter() - start_time
 
             # Extract predictions
             predicted_match_decision = normalize_match_decision(
@@ -140,96 +177,178 @@ def run_evaluation():
             predicted_sentiment = normalize_sentiment(final_state.get('sentiment', 'N/A'))
 
             # Ground truth
-            ground_truth_match = "match" if row['is_match'] else "non-match"
-            ground_truth_sentiment = normalize_sentiment(row['sentiment_label'])
+            ground_truth_match = row['gt_match']
+            ground_truth_sentiment = row['gt_sentiment']
 
             # Calculate accuracy
             match_is_correct = (predicted_match_decision == ground_truth_match)
             sentiment_is_correct = (predicted_sentiment == ground_truth_sentiment)
 
-            if match_is_correct:
-                match_correct += 1
-            match_total += 1
-
-            # Only count sentiment if it's a match case
-            if ground_truth_match == "match":
-                if sentiment_is_correct:
-                    sentiment_correct += 1
-                sentiment_total += 1
-
             # Token usage
             token_usage = final_state.get('token_usage', {})
-            case_tokens = sum(usage.get('total_tokens', 0) for usage in token_usage.values())
+            case_tokens = final_state.get('total_tokens', 0)
             llm_calls = len(token_usage)
 
-            # Check if LLM call was skipped
-            name_check_skipped = 'check_name_presence' not in token_usage and not final_state.get('name_is_present', False)
-            if name_check_skipped:
-                llm_calls_saved += 1
-
-            total_tokens += case_tokens
-            total_execution_time += execution_time
-
-            logger.info(f"  Prediction: Match={predicted_match_decision}, Sentiment={predicted_sentiment}")
-            logger.info(f"  Correct: Match={match_is_correct}, Sentiment={sentiment_is_correct if ground_truth_match == 'match' else 'N/A'}")
-            logger.info(f"  Tokens: {case_tokens} | LLM Calls: {llm_calls}/4 | Time: {execution_time:.2f}s")
-
-            # Store result
-            results.append({
-                'case_number': case_num,
-                'person_name': row['person_name'],
-                'dob': row['dob'],
-                'scenario': row['scenario'],
-                'language': row['language'],
-                'article_title': row['article_title'],
-                'ground_truth_match': ground_truth_match,
-                'predicted_match': predicted_match_decision,
-                'match_correct': match_is_correct,
-                'ground_truth_sentiment': ground_truth_sentiment,
-                'predicted_sentiment': predicted_sentiment,
-                'sentiment_correct': sentiment_is_correct if ground_truth_match == 'match' else None,
-                'match_decision_raw': final_state.get('match_decision', ''),
-                'match_explanation': final_state.get('match_explanation', ''),
-                'sentiment_raw': final_state.get('sentiment', ''),
-                'sentiment_explanation': final_state.get('sentiment_explanation', ''),
-                'name_is_present': final_state.get('name_is_present', False),
-                'age_matches': final_state.get('age_matches', False),
-                'llm_calls_made': llm_calls,
-                'name_check_skipped': name_check_skipped,
-                'tokens_used': case_tokens,
-                'execution_time_seconds': round(execution_time, 2),
-                'status': 'success'
-            })
+            # LLM calls the graph avoided (quick name check or cache hits)
+            llm_calls_skipped = final_state.get('skipped_calls', 0)
+
+            logger.info(f"  [{case_num}] Prediction: Match={predicted_match_decision}, Sentiment={predicted_sentiment}")
+            logger.info(f"  [{case_num}] Correct: Match={match_is_correct}, Sentiment={sentiment_is_correct if ground_truth_match == 'match' else 'N/A'}")
+            logger.info(f"  [{case_num}] Tokens: {case_tokens} | LLM Calls: {llm_calls}/4 | Time: {execution_time:.2f}s")
+
+            record_result(
+                writer,
+                results_file,
+                case_number=case_num,
+                person_name=row['person_name'],
+                dob=row['dob'],
+                scenario=row['scenario'],
+                language=row['language'],
+                article_title=row['article_title'],
+                ground_truth_match=ground_truth_match,
+                predicted_match=predicted_match_decision,
+                match_correct=match_is_correct,
+                ground_truth_sentiment=ground_truth_sentiment,
+                predicted_sentiment=predicted_sentiment,
+                sentiment_correct=sentiment_is_correct if ground_truth_match == 'match' else None,
+                match_decision_raw=final_state.get('match_decision', ''),
+                match_explanation=final_state.get('match_explanation', ''),
+                sentiment_raw=final_state.get('sentiment', ''),
+                sentiment_explanation=final_state.get('sentiment_explanation', ''),
+                name_is_present=final_state.get('name_is_present', False),
+                age_matches=final_state.get('age_matches', False),
+                llm_calls_made=llm_calls,
+                llm_calls_skipped=llm_calls_skipped,
+                tokens_used=case_tokens,
+                execution_time_seconds=round(execution_time, 2),
+                status='success'
+            )
 
         except Exception as e:
-            logger.error(f"  ERROR: {e}", exc_info=True)
-            execution_time = time.time() - start_time
-
-            results.append({
-                'case_number': case_num,
-                'person_name': row['person_name'],
-                'dob': row['dob'],
-                'scenario': row['scenario'],
-                'language': row['language'],
-                'article_title': row['article_title'],
-                'ground_truth_match': "match" if row['is_match'] else "non-match",
-                'predicted_match': 'error',
-                'match_correct': False,
-                'ground_truth_sentiment': normalize_sentiment(row['sentiment_label']),
-                'predicted_sentiment': 'error',
-                'sentiment_correct': False,
-                'match_decision_raw': '',
-                'match_explanation': str(e),
-                'sentiment_raw': '',
-                'sentiment_explanation': '',
-                'name_is_present': False,
-                'age_matches': False,
-                'llm_calls_made': 0,
-                'name_check_skipped': False,
-                'tokens_used': 0,
-                'execution_time_seconds': round(execution_time, 2),
-                'status': 'error'
-            })
+            logger.error(f"  [{case_num}] ERROR: {e}", exc_info=True)
+            execution_time = time.perf_counter() - start_time
+
+            record_result(
+                writer,
+                results_file,
+                case_number=case_num,
+                person_name=row['person_name'],
+                dob=row['dob'],
+                scenario=row['scenario'],
+                language=row['language'],
+                article_title=row['article_title'],
+                ground_truth_match=row['gt_match'],
+                predicted_match='error',
+                match_correct=False,
+                ground_truth_sentiment=row['gt_sentiment'],
+                predicted_sentiment='error',
+                sentiment_correct=False,
+                match_decision_raw='',
+                match_explanation=str(e),
+                sentiment_raw='',
+                sentiment_explanation='',
+                name_is_present=False,
+                age_matches=False,
+                llm_calls_made=0,
+                llm_calls_skipped=0,
+                tokens_used=0,
+                execution_time_seconds=round(execution_time, 2),
+                status='error'
+            )
+
+        finally:
+            if final_state and final_state.get('article_context'):
+                await asyncio.to_thread(release_article_context, final_state)
+
+
+async def evaluate_cases(app, records: list, results_csv_path: Path) -> pd.DataFrame:
+    """
+    Evaluate all dataset rows concurrently, bounded by MAX_CONCURRENT_CASES.
+
+    Cases are independent and dominated by LLM network latency, so overlapping
+    them cuts wall time from the sum of case latencies to roughly one batch.
+    Each result is streamed to results_csv_path as soon as its case completes.
+
+    Args:
+        app: Compiled LangGraph workflow
+        records: Evaluation dataset rows as plain dictionaries
+        results_csv_path: Path of the detailed results CSV to write
+
+    Returns:
+        DataFrame of per-case results read back from the CSV, in dataset order
+    """
+    size_node_executor(MAX_CONCURRENT_CASES)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CASES)
+    with open(results_csv_path, 'w', newline='', encoding='utf-8') as results_file:
+        writer = csv.DictWriter(results_file, fieldnames=RESULT_COLUMNS)
+        writer.writeheader()
+        tasks = [
+            evaluate_case(app, row, idx + 1, len(records), semaphore, writer, results_file)
+            for idx, row in enumerate(records)
+        ]
+        await asyncio.gather(*tasks)
+
+    # Rows are written in completion order; restore dataset order for the report
+    return pd.read_csv(results_csv_path).sort_values('case_number', ignore_index=True)
+
+
+def run_evaluation():
+    """Run evaluation on diverse synthetic articles dataset."""
+
+    logger.info(SEPARATOR)
+    logger.info("ARTICLE PERSON VERIFICATION - ACCURACY EVALUATION")
+    logger.info(SEPARATOR)
+
+    # Connect to Gemini while the dataset is loaded and the graph is built
+    threading.Thread(target=warm_up_llm, name="llm-warm-up", daemon=True).start()
+
+    # Load ground truth dataset
+    dataset_path = "diverse_synthetic_articles.csv"
+    if not os.path.exists(dataset_path):
+        logger.error(f"Dataset not found: {dataset_path}")
+        return
+
+    df = load_dataset(dataset_path)
+    logger.info(f"Loaded {len(df)} test cases from {dataset_path}")
+    logger.info(f"Columns: {', '.join(df.columns.tolist())}")
+
+    df = add_ground_truth_columns(df)
+
+    # Plain dicts avoid building a pandas Series for every row
+    records = df.to_dict('records')
+
+    # Build graph with a shared cache so articles reused across cases are only processed once
+    logger.info("Building LangGraph workflow...")
+    article_cache = {}
+    app = build_graph(article_cache=article_cache)
+    logger.info("Graph compiled successfully")
+
+    results_dir = Path("evaluation_results")
+    results_dir.mkdir(exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_csv_path = results_dir / f"detailed_results_{timestamp}.csv"
+
+    logger.info(f"\nStarting evaluation on {len(df)} cases (concurrency: {MAX_CONCURRENT_CASES})...")
+    logger.info(f"Streaming results to: {results_csv_path}")
+    logger.info(SEPARATOR)
+
+    wall_start_time = time.perf_counter()
+    df_results = asyncio.run(evaluate_cases(app, records, results_csv_path))
+    wall_clock_time = time.perf_counter() - wall_start_time
+
+    # Aggregate per-case results (done after gather so concurrent cases never share counters)
+    successful = df_results[df_results['status'] == 'success']
+    errors = df_results[df_results['status'] == 'error']
+    match_correct = int(successful['match_correct'].sum())
+    match_total = len(successful)
+    sentiment_cases = successful[successful['ground_truth_match'] == 'match']
+    sentiment_correct = int(sentiment_cases['sentiment_correct'].astype(bool).sum())
+    sentiment_total = len(sentiment_cases)
+
+    llm_calls_saved = int(df_results['llm_calls_skipped'].sum())
+    total_tokens = int(df_results['tokens_used'].sum())
+    total_execution_time = float(df_results['execution_time_seconds'].sum())
 
     # Calculate final metrics
     match_accuracy = (match_correct / match_total * 100) if match_total > 0 else 0
@@ -238,12 +357,12 @@ def run_evaluation():
     avg_time = total_execution_time / len(df) if len(df) > 0 else 0
 
     # Print summary
-    logger.info("\n" + "=" * 80)
+    logger.info("\n" + SEPARATOR)
     logger.info("EVALUATION SUMMARY")
-    logger.info("=" * 80)
+    logger.info(SEPARATOR)
     logger.info(f"Total Cases: {len(df)}")
-    logger.info(f"Successful: {len([r for r in results if r['status'] == 'success'])}")
-    logger.info(f"Errors: {len([r for r in results if r['status'] == 'error'])}")
+    logger.info(f"Successful: {len(successful)}")
+    logger.info(f"Errors: {len(errors)}")
     logger.info("")
     logger.info("MATCH ACCURACY:")
     logger.info(f"  Correct: {match_correct}/{match_total}")
@@ -256,28 +375,20 @@ def run_evaluation():
     logger.info("PERFORMANCE:")
     logger.info(f"  Total Tokens Used: {total_tokens:,}")
     logger.info(f"  Avg Tokens/Case: {avg_tokens:.0f}")
-    logger.info(f"  LLM Calls Skipped: {llm_calls_saved}/{len(df)} ({llm_calls_saved/len(df)*100:.1f}%)")
+    logger.info(f"  LLM Calls Skipped: {llm_calls_saved} ({llm_calls_saved/len(df):.2f}/case)")
     logger.info(f"  Total Execution Time: {total_execution_time:.2f}s")
     logger.info(f"  Avg Time/Case: {avg_time:.2f}s")
-    logger.info("=" * 80)
+    logger.info(f"  Wall Clock Time: {wall_clock_time:.2f}s")
+    logger.info(f"  Article Cache Entries: {len(article_cache)}")
+    logger.info(SEPARATOR)
 
-    # Save results
-    results_dir = Path("evaluation_results")
-    results_dir.mkdir(exist_ok=True)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    # Save detailed results CSV
-    results_csv_path = results_dir / f"detailed_results_{timestamp}.csv"
-    df_results = pd.DataFrame(results)
-    df_results.to_csv(results_csv_path, index=False)
     logger.info(f"\nDetailed results saved to: {results_csv_path}")
 
     # Save summary report
     summary_path = results_dir / f"summary_report_{timestamp}.txt"
     with open(summary_path, 'w', encoding='utf-8') as f:
         f.write("ARTICLE PERSON VERIFICATION - ACCURACY EVALUATION REPORT\n")
-        f.write("=" * 80 + "\n")
+        f.write(SEPARATOR + "\n")
         f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         f.write(f"Dataset: {dataset_path}\n")
         f.write(f"Total Cases: {len(df)}\n\n")
@@ -291,26 +402,27 @@ def run_evaluation():
         f.write("-" * 80 + "\n")
         f.write(f"Total Tokens: {total_tokens:,}\n")
         f.write(f"Avg Tokens/Case: {avg_tokens:.0f}\n")
-        f.write(f"LLM Calls Skipped: {llm_calls_saved}/{len(df)} ({llm_calls_saved/len(df)*100:.1f}%)\n")
+        f.write(f"LLM Calls Skipped: {llm_calls_saved} ({llm_calls_saved/len(df):.2f}/case)\n")
         f.write(f"Total Time: {total_execution_time:.2f}s\n")
-        f.write(f"Avg Time/Case: {avg_time:.2f}s\n\n")
+        f.write(f"Avg Time/Case: {avg_time:.2f}s\n")
+        f.write(f"Wall Clock Time: {wall_clock_time:.2f}s\n\n")
 
-        f.write("BREAKDOWN BY SCENARIO:\n")
-        f.write("-" * 80 + "\n")
-        scenario_stats = df_results.groupby('scenario').agg({
+        # One grouped pass over the results, marginalized per dimension
+        breakdown = df_results.groupby(['scenario', 'language']).agg({
             'match_correct': 'sum',
             'case_number': 'count'
         }).rename(columns={'case_number': 'total'})
+
+        f.write("BREAKDOWN BY SCENARIO:\n")
+        f.write("-" * 80 + "\n")
+        scenario_stats = breakdown.groupby(level='scenario').sum()
         scenario_stats['accuracy'] = scenario_stats['match_correct'] / scenario_stats['total'] * 100
         f.write(scenario_stats.to_string())
         f.write("\n\n")
 
         f.write("BREAKDOWN BY LANGUAGE:\n")
         f.write("-" * 80 + "\n")
-        lang_stats = df_results.groupby('language').agg({
-            'match_correct': 'sum',
-            'case_number': 'count'
-        }).rename(columns={'case_number': 'total'})
+        lang_stats = breakdown.groupby(level='language').sum()
         lang_stats['accuracy'] = lang_stats['match_correct'] / lang_stats['total'] * 100
         f.write(lang_stats.to_string())
         f.write("\n")
@@ -318,10 +430,9 @@ def run_evaluation():
     logger.info(f"Summary report saved to: {summary_path}")
 
     # Save errors separately if any
-    errors = [r for r in results if r['status'] == 'error']
-    if errors:
+    if not errors.empty:
         errors_csv_path = results_dir / f"errors_{timestamp}.csv"
-        pd.DataFrame(errors).to_csv(errors_csv_path, index=False)
+        errors.to_csv(errors_csv_path, index=False)
         logger.info(f"Errors saved to: {errors_csv_path}")
 
     logger.info("\nEvaluation complete!")
@@ -7,275 +7,486 @@ the sentiment of those articles using AI and LangGraph.
 
 import os
 import argparse
-import uuid
+import asyncio
+import secrets
 import time
+import threading
+from functools import lru_cache
+from typing import Iterable, Optional
+from pathlib import Path
 from datetime import datetime
-import mlflow
 
 from src.config import (
     MLFLOW_TRACKING_URI,
     MLFLOW_EXPERIMENT_NAME,
+    MLFLOW_PER_STEP_ARTIFACTS,
     DEFAULT_TEST_CASES_FILE,
     GEMINI_MODEL_NAME,
+    MAX_CASES_PER_MINUTE,
+    MAX_CONCURRENT_CASES,
+    LLM_RESPONSE_CACHE,
     )
-from src.utils import load_test_cases, setup_logger
-from src.graph import build_graph
-mlflow.langchain.autolog()
+from src.utils import load_test_cases, load_watchlist, NameWatchlist, fetch_article_text, is_fetch_error, setup_logger, dumps_json, MlflowLoggingQueue, AsyncRateLimiter
+
+# mlflow and the graph (LangChain, Gemini SDK) are imported lazily so `--help` and argument errors return quickly
 
 # Setup logger
 logger = setup_logger(name="ArticleVerification", log_level="Debug")
 
-def run_verification(app, case: dict) -> None:
+# Metric set to 1 for the run's match decision / sentiment; the others in the same group are logged as 0
+MATCH_DECISION_METRICS = {
+    "Match": "is_match",
+    "Non-Match": "is_non_match",
+    "Review Required": "needs_review",
+    "Age Mismatch - Needs Verification": "age_mismatch",
+}
+SENTIMENT_METRICS = {
+    "Negative": "sentiment_negative",
+    "Positive": "sentiment_positive",
+    "Neutral": "sentiment_neutral",
+}
+
+# End-of-run batches and run termination are sent from a background thread; main() flushes it before exiting
+mlflow_queue = MlflowLoggingQueue()
+
+# MLflow accepts at most 100 params and 100 tags (and 1000 entries in total) per log_batch call
+MLFLOW_BATCH_SIZE = 100
+
+# Banner line framing each case and the batch summary in the log
+SEPARATOR = "=" * 50
+
+
+@lru_cache(maxsize=1)
+def get_mlflow_client():
+    """
+    Return the MlflowClient shared by every run.
+
+    One client means the tracking store (SQLAlchemy engine / HTTP session) is built once.
+
+    Returns:
+        MlflowClient bound to MLFLOW_TRACKING_URI
+    """
+    import mlflow
+    return mlflow.MlflowClient(tracking_uri=MLFLOW_TRACKING_URI)
+
+
+def log_batch_chunked(client, run_id: str, metrics: list, params: list, tags: list) -> None:
+    """
+    Log accumulated metrics, params and tags with as few log_batch calls as MLflow allows.
+
+    Args:
+        client: MLflow client bound to the current tracking URI
+        run_id: Run to log to
+        metrics: List of mlflow.entities.Metric
+        params: List of mlflow.entities.Param
+        tags: List of mlflow.entities.RunTag
+    """
+    for start in range(0, max(len(metrics), len(params), len(tags)), MLFLOW_BATCH_SIZE):
+        end = start + MLFLOW_BATCH_SIZE
+        client.log_batch(run_id, metrics=metrics[start:end], params=params[start:end], tags=tags[start:end])
+
+
+async def run_verification(app, case: dict, experiment_id: str) -> None:
     """
     Run verification for a single test case with comprehensive MLflow logging.
 
+    The graph is streamed with app.astream so several cases can share one event loop.
+    MLflow's fluent API keeps the active run per thread, which concurrent coroutines
+    would share, so the run is created and logged to through MlflowClient with an
+    explicit run_id. Blocking tracking calls are moved off the event loop with
+    asyncio.to_thread.
+
     Args:
         app: Compiled LangGraph workflow
         case: Dictionary containing 'name', 'dob', and 'url' keys
+        experiment_id: MLflow experiment the run is created in
     """
-    logger.info("=" * 50)
-    try:
-        logger.info(f"RUNNING CASE FOR: {case['name']} ({case['dob']})")
-        url_display = case['url'][:100] + "..." if len(case['url']) > 100 else case['url']
-        logger.info(f"URL: {url_display}")
-    except UnicodeEncodeError:
-        # Fallback for Windows console encoding issues
-        logger.info(f"RUNNING CASE FOR: {case['name']} ({case['dob']})")
-        logger.info("URL: [Content contains non-ASCII characters]")
-    logger.info("=" * 50)
+    logger.info(SEPARATOR)
+    logger.info(f"RUNNING CASE FOR: {case['name']} ({case['dob']})")
+    url_display = case['url'][:100] + "..." if len(case['url']) > 100 else case['url']
+    logger.info(f"URL: {url_display}")
+    logger.info(SEPARATOR)
+
+    from mlflow.entities import Metric, Param, RunTag
+    from src.graph import INITIAL_STATE_DEFAULTS
+    mlflow_client = get_mlflow_client()
 
     # Start MLflow run
-    run_name = f"Screening {case['name']} - {uuid.uuid4().hex[:8]}"
-    with mlflow.start_run(run_name=run_name) as run:
-        run_id = run.info.run_id
-        start_time = time.time()
-
-        logger.info(f"Starting MLflow Run: {run_id}")
-        logger.info(f"Run Name: {run_name}")
-
-        # Enable autologging for LangChain/LangGraph
-        mlflow.langchain.autolog()
-
-        # Log system metadata as tags
-        mlflow.set_tag("mlflow.runName", run_name)
-        mlflow.set_tag("execution_date", datetime.now().strftime("%Y-%m-%d"))
-        mlflow.set_tag("execution_time", datetime.now().strftime("%H:%M:%S"))
-        mlflow.set_tag("model", GEMINI_MODEL_NAME)
-
-        # Log initial inputs as parameters
-        mlflow.log_param("applicant_name", case['name'])
-        mlflow.log_param("applicant_dob", case['dob'])
-        mlflow.log_param("article_url", case['url'])
-
-        # Initialize state
-        current_state = {
+    run_name = f"Screening {case['name']} - {secrets.token_hex(4)}"
+    run = await asyncio.to_thread(mlflow_client.create_run, experiment_id, run_name=run_name)
+    run_id = run.info.run_id
+    start_ns = time.perf_counter_ns()
+
+    # Metrics, params and tags are accumulated and sent in one log_batch call at the end of the run.
+    # Params and tags are keyed so a later value replaces an earlier one, as set_tag does.
+    metrics, params, tags = [], {}, {}
+
+    def log_metric(key: str, value: float, step: int = 0) -> None:
+        metrics.append(Metric(key, float(value), int(time.time() * 1000), step))
+
+    def log_param(key: str, value) -> None:
+        params[key] = Param(key, str(value)[:500])
+
+    def set_tag(key: str, value) -> None:
+        tags[key] = RunTag(key, str(value))
+
+    logger.info(f"Starting MLflow Run: {run_id}")
+    logger.info(f"Run Name: {run_name}")
+
+    # Log system metadata as tags (one clock reading, also used for the execution summary)
+    started_at = datetime.now()
+    set_tag("execution_date", started_at.strftime("%Y-%m-%d"))
+    set_tag("execution_time", started_at.strftime("%H:%M:%S"))
+    set_tag("model", GEMINI_MODEL_NAME)
+
+    # Log initial inputs as parameters
+    log_param("applicant_name", case['name'])
+    log_param("applicant_dob", case['dob'])
+    log_param("article_url", case['url'])
+
+    # Initialize state
+    current_state = {
+        **INITIAL_STATE_DEFAULTS,
+        "applicant_name": case['name'],
+        "applicant_dob": case['dob'],
+        "article_url": case['url']
+    }
+
+    state_history = []
+    node_execution_times = {}
+
+    # Execute graph with MLflow logging
+    try:
+        step_counter = 0
+        total_nodes_executed = 0
+
+        # Stream through the graph to capture intermediate outputs ("updates") and the merged
+        # state after each step ("values", with the GraphState reducers applied).
+        # A node's duration is the time since the previous node's output arrived.
+        step_start_ns = start_ns
+        async for mode, chunk in app.astream(current_state, stream_mode=["updates", "values"]):
+            if mode == "values":
+                current_state = chunk
+                continue
+            if not chunk:
+                continue
+
+            step_end_ns = time.perf_counter_ns()
+            node_execution_ms = (step_end_ns - step_start_ns) / 1e6
+            step_start_ns = step_end_ns
+
+            # Extract node name and output
+            node_name, node_output = next(iter(chunk.items()))
+            logger.debug(f"[Step {step_counter}] Node '{node_name}' executed")
+
+            # Track node execution time (seconds, as in node_execution_times.json)
+            node_execution_times[node_name] = node_execution_ms / 1000
+
+            # Log node execution time as metric
+            log_metric(f"node_{node_name}_duration_ms", node_execution_ms, step=step_counter)
+
+            # article_text is uploaded on its own as article_text.txt, so step records leave it out
+            step_delta = {k: v for k, v in node_output.items() if k != 'article_text'}
+
+            # Per-step deltas are debug-only and uploaded from the background queue, off the stream loop;
+            # the full history is logged once after the run
+            if MLFLOW_PER_STEP_ARTIFACTS:
+                log_name = f"step_{step_counter:02d}_{node_name}_delta.json"
+                mlflow_queue.submit(mlflow_client.log_text, run_id, dumps_json(step_delta), log_name)
+
+            state_history.append({
+                "step": step_counter,
+                "node": node_name,
+                "output": step_delta,
+                "execution_time_ms": round(node_execution_ms, 2)
+            })
+            step_counter += 1
+            total_nodes_executed += 1
+
+        # Calculate total execution time
+        total_execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+        # Log final results
+        final_state = current_state
+        match_decision = final_state.get('match_decision', 'ERROR')
+        sentiment_value = final_state.get('sentiment', 'N/A')
+        name_is_present = final_state.get('name_is_present', False)
+        age_matches = final_state.get('age_matches', False)
+
+        logger.info("FINAL RESULT (logged to MLflow)")
+        logger.info(f"  Match Decision: {match_decision}")
+        logger.info(f"  Explanation: {final_state.get('match_explanation')}")
+        logger.info(f"  Sentiment: {sentiment_value}")
+        logger.info(f"  Explanation: {final_state.get('sentiment_explanation')}")
+
+        # Log key outcomes as tags (for easy filtering/grouping in MLflow UI)
+        set_tag("match_decision", match_decision)
+        set_tag("sentiment", sentiment_value)
+        set_tag("name_is_present", str(name_is_present))
+        set_tag("age_matches", str(age_matches))
+        set_tag("status", "COMPLETED")
+
+        # Log boolean flags as metrics (for dashboard aggregation and analysis)
+        log_metric("name_found", 1 if name_is_present else 0)
+        log_metric("age_verified", 1 if age_matches else 0)
+        decision_metric = MATCH_DECISION_METRICS.get(match_decision)
+        for metric_name in MATCH_DECISION_METRICS.values():
+            log_metric(metric_name, 1 if metric_name == decision_metric else 0)
+
+        # Log sentiment metrics (for tracking sentiment distribution)
+        sentiment_metric = SENTIMENT_METRICS.get(sentiment_value)
+        for metric_name in SENTIMENT_METRICS.values():
+            log_metric(metric_name, 1 if metric_name == sentiment_metric else 0)
+
+        # Log execution performance metrics
+        log_metric("total_execution_time_seconds", total_execution_time)
+        log_metric("total_nodes_executed", total_nodes_executed)
+        log_metric("article_text_length", len(final_state.get('article_text', '')))
+
+        # Log per-node token usage metrics
+        token_usage = final_state.get('token_usage', {})
+        for node_name, usage in token_usage.items():
+            log_metric(f"tokens_{node_name}_prompt", usage.get('prompt_tokens', 0))
+            log_metric(f"tokens_{node_name}_completion", usage.get('completion_tokens', 0))
+            log_metric(f"tokens_{node_name}_total", usage.get('total_tokens', 0))
+
+        # Totals across all LLM calls (the graph already accumulates total_tokens)
+        total_prompt_tokens = sum(usage.get('prompt_tokens', 0) for usage in token_usage.values())
+        total_completion_tokens = sum(usage.get('completion_tokens', 0) for usage in token_usage.values())
+        total_tokens = final_state.get('total_tokens', 0)
+
+        # Log total token usage across all LLM calls
+        log_metric("tokens_total_prompt", total_prompt_tokens)
+        log_metric("tokens_total_completion", total_completion_tokens)
+        log_metric("tokens_total_all", total_tokens)
+
+        # Track if LLM call was skipped for name check (cost optimization), as recorded by the name-check node
+        llm_calls_made = len(token_usage)
+        fetch_failed = is_fetch_error(final_state.get('article_text', ''))
+        name_check_skipped = final_state.get('name_check_skipped', False)
+        log_metric("llm_calls_made", llm_calls_made)
+        log_metric("llm_calls_skipped", final_state.get('skipped_calls', 0))
+        log_metric("name_check_llm_skipped", 1 if name_check_skipped else 0)
+
+        if fetch_failed:
+            logger.info("Article could not be fetched: no LLM calls made")
+        elif name_check_skipped:
+            logger.info("Quick name check: LLM call SKIPPED (name not found via keyword search)")
+            logger.info(f"LLM Calls Made: {llm_calls_made}/4 (saved 1 call)")
+        else:
+            logger.info(f"LLM Calls Made: {llm_calls_made}")
+
+        logger.info(f"Total Token Usage: {total_prompt_tokens} prompt + {total_completion_tokens} completion = {total_tokens} total")
+
+        # Log explanations as parameters (log_param truncates them to avoid size limits)
+        log_param("name_check_explanation", final_state.get('name_check_explanation', ''))
+        log_param("age_check_explanation", final_state.get('age_check_explanation', ''))
+        log_param("match_explanation", final_state.get('match_explanation', ''))
+        log_param("sentiment_explanation", final_state.get('sentiment_explanation', ''))
+
+        # article_text.txt (logged in finally) is the single copy of the article body
+        slim_final_state = {k: v for k, v in final_state.items() if k != 'article_text'}
+
+        # Upload artifacts concurrently, each in a worker thread off the event loop
+        artifact_uploads = [
+            lambda: mlflow_client.log_text(run_id, dumps_json(state_history), "run_state_history.json"),
+            lambda: mlflow_client.log_text(run_id, dumps_json(slim_final_state), "final_state.json"),
+            lambda: mlflow_client.log_text(run_id, dumps_json(node_execution_times), "node_execution_times.json"),
+            lambda: mlflow_client.log_text(run_id, dumps_json(token_usage), "token_usage.json"),
+        ]
+        await asyncio.gather(*(asyncio.to_thread(upload) for upload in artifact_uploads))
+
+        # Create and log execution summary
+        execution_summary = {
+            "run_id": run_id,
+            "run_name": run_name,
             "applicant_name": case['name'],
             "applicant_dob": case['dob'],
             "article_url": case['url'],
-            "article_text": "",
-            "name_is_present": False,
-            "name_check_explanation": "",
-            "age_matches": False,
-            "age_check_explanation": "",
-            "match_decision": "Review Required",
-            "match_explanation": "",
-            "sentiment": "N/A",
-            "sentiment_explanation": "",
-            "token_usage": {}
+            "match_decision": match_decision,
+            "sentiment": sentiment_value,
+            "name_is_present": name_is_present,
+            "age_matches": age_matches,
+            "total_execution_time_seconds": round(total_execution_time, 2),
+            "total_nodes_executed": total_nodes_executed,
+            "total_tokens_used": total_tokens,
+            "total_prompt_tokens": total_prompt_tokens,
+            "total_completion_tokens": total_completion_tokens,
+            "execution_timestamp": started_at.isoformat()
+        }
+        await asyncio.to_thread(mlflow_client.log_text, run_id, dumps_json(execution_summary), "execution_summary.json")
+
+        logger.info(f"Total Execution Time: {total_execution_time:.2f}s")
+        logger.info(f"MLflow Run {run_id} Finished")
+        logger.info(SEPARATOR)
+
+    except Exception as e:
+        total_execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+        logger.error(f"Graph execution FAILED: {e}", exc_info=True)
+
+        # Log error details
+        set_tag("status", "FAILED")
+        set_tag("error_type", type(e).__name__)
+        log_param("error_message", str(e))
+
+        # Log execution metrics even on failure
+        log_metric("total_execution_time_seconds", total_execution_time)
+        log_metric("total_nodes_executed", step_counter)
+        log_metric("execution_failed", 1)
+
+        # Log partial results
+        if state_history:
+            await asyncio.to_thread(mlflow_client.log_text, run_id, dumps_json(state_history), "partial_state_history.json")
+        if current_state:
+            partial_state = {k: v for k, v in current_state.items() if k != 'article_text'}
+            await asyncio.to_thread(mlflow_client.log_text, run_id, dumps_json(partial_state), "partial_final_state.json")
+
+        # Create error summary
+        error_summary = {
+            "run_id": run_id,
+            "error_type": type(e).__name__,
+            "error_message": str(e),
+            "failed_at_step": step_counter,
+            "execution_time_before_failure": round(total_execution_time, 2),
+            "timestamp": datetime.now().isoformat()
         }
+        await asyncio.to_thread(mlflow_client.log_text, run_id, dumps_json(error_summary), "error_summary.json")
+
+        logger.error(f"MLflow Run {run_id} Marked as FAILED")
+
+    finally:
+        # Drop the run's Gemini context cache (GEMINI_CONTEXT_CACHING) now instead of waiting for its TTL
+        if current_state.get('article_context'):
+            from src.graph import release_article_context
+            await asyncio.to_thread(release_article_context, current_state)
+
+        # Upload the article once, on both the success and the failure path
+        article_text = current_state.get('article_text', '')
+        if article_text:
+            mlflow_queue.submit(mlflow_client.log_text, run_id, article_text, "article_text.txt")
+        mlflow_queue.submit(log_batch_chunked, mlflow_client, run_id, metrics, list(params.values()), list(tags.values()))
+        mlflow_queue.submit(mlflow_client.set_terminated, run_id)
+
+
+async def run_verification_task(app, case: dict, experiment_id: str, idx: int,
+                                rate_limiter: AsyncRateLimiter) -> bool:
+    """
+    Run a single verification case on one of the batch workers.
+
+    Args:
+        app: Compiled LangGraph workflow
+        case: Dictionary containing 'name', 'dob', and 'url' keys
+        experiment_id: MLflow experiment the run is created in
+        idx: 1-based position of the case in the batch
+        rate_limiter: Bounds how many cases start per minute
+
+    Returns:
+        True if the case completed, False if it failed
+    """
+    # Spread case starts over time to prevent cascading rate limit errors
+    await rate_limiter.acquire()
+    logger.info(f"[{idx}] Processing case...")
+    try:
+        await run_verification(app, case, experiment_id)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to process case: {e}", exc_info=True)
+        return False
+
+
+async def run_all_verifications(app, test_cases: Iterable[dict], experiment_id: str, concurrency: int) -> list:
+    """
+    Run verification cases concurrently on a fixed pool of workers.
+
+    Cases are pulled from test_cases through a queue bounded to twice the concurrency,
+    so a large CSV streams in as workers free up instead of being loaded up front.
+
+    Args:
+        app: Compiled LangGraph workflow
+        test_cases: Iterable of valid test case dictionaries (e.g. from load_test_cases)
+        experiment_id: MLflow experiment the runs are created in
+        concurrency: Maximum number of cases processed at the same time
+
+    Returns:
+        List of booleans (one per case, in completion order) indicating success
+    """
+    from src.graph import size_node_executor
+    size_node_executor(concurrency)
+
+    rate_limiter = AsyncRateLimiter(MAX_CASES_PER_MINUTE, period=60.0)
+    pending = asyncio.Queue(maxsize=2 * concurrency)
+    outcomes = []
+
+    async def worker():
+        while True:
+            item = await pending.get()
+            if item is None:
+                return
+            idx, case = item
+            outcomes.append(await run_verification_task(app, case, experiment_id, idx, rate_limiter))
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    for idx, case in enumerate(test_cases, 1):
+        await pending.put((idx, case))
+    for _ in workers:
+        await pending.put(None)
+    await asyncio.gather(*workers)
+    return outcomes
+
+
+def watchlist_cases(watchlist_file: str, article_input: str) -> Optional[list]:
+    """
+    Build the cases for the watchlist applicants that may be mentioned in one article.
+
+    One pass over the article picks the applicants worth a graph run; the fetched page is
+    cached, so the graph's fetch_article reuses it.
+
+    Args:
+        watchlist_file: Path to the CSV of applicants (name, dob)
+        article_input: URL of the article or the article text
 
-        state_history = []
-        node_execution_times = {}
-
-        # Execute graph with MLflow logging
-        try:
-            step_counter = 0
-            total_nodes_executed = 0
-
-            # Stream through the graph to capture intermediate outputs
-            for chunk in app.stream(current_state):
-                if not chunk:
-                    continue
-
-                node_start_time = time.time()
-
-                # Extract node name and output
-                node_name, node_output = list(chunk.items())[0]
-                logger.debug(f"[Step {step_counter}] Node '{node_name}' executed")
-
-                # Update state
-                current_state.update(node_output)
-
-                # Track node execution time
-                node_execution_time = time.time() - node_start_time
-                node_execution_times[node_name] = node_execution_time
-
-                # Log node execution time as metric
-                mlflow.log_metric(f"node_{node_name}_duration_ms", node_execution_time * 1000, step=step_counter)
-
-                # Log state after this step
-                log_name = f"step_{step_counter:02d}_{node_name}_state.json"
-                mlflow.log_dict(current_state.copy(), log_name)
-
-                state_history.append({
-                    "step": step_counter,
-                    "node": node_name,
-                    "output": node_output,
-                    "execution_time_ms": round(node_execution_time * 1000, 2)
-                })
-                step_counter += 1
-                total_nodes_executed += 1
-
-            # Calculate total execution time
-            total_execution_time = time.time() - start_time
-
-            # Log final results
-            final_state = current_state
-
-            logger.info("FINAL RESULT (logged to MLflow)")
-            try:
-                logger.info(f"  Match Decision: {final_state.get('match_decision')}")
-                logger.info(f"  Explanation: {final_state.get('match_explanation')}")
-                logger.info(f"  Sentiment: {final_state.get('sentiment', 'N/A')}")
-                logger.info(f"  Explanation: {final_state.get('sentiment_explanation')}")
-            except UnicodeEncodeError:
-                logger.info(f"  Match Decision: {final_state.get('match_decision')}")
-                logger.info("  Explanation: [Contains non-ASCII characters - see MLflow artifacts]")
-                logger.info(f"  Sentiment: {final_state.get('sentiment', 'N/A')}")
-                logger.info("  Explanation: [Contains non-ASCII characters - see MLflow artifacts]")
-
-            # Log key outcomes as tags (for easy filtering/grouping in MLflow UI)
-            mlflow.set_tag("match_decision", final_state.get('match_decision', 'ERROR'))
-            mlflow.set_tag("sentiment", final_state.get('sentiment', 'N/A'))
-            mlflow.set_tag("name_is_present", str(final_state.get('name_is_present', False)))
-            mlflow.set_tag("age_matches", str(final_state.get('age_matches', False)))
-            mlflow.set_tag("status", "COMPLETED")
-
-            # Log boolean flags as metrics (for dashboard aggregation and analysis)
-            mlflow.log_metric("name_found", 1 if final_state.get('name_is_present') else 0)
-            mlflow.log_metric("age_verified", 1 if final_state.get('age_matches') else 0)
-            mlflow.log_metric("is_match", 1 if final_state.get('match_decision') == "Match" else 0)
-            mlflow.log_metric("is_non_match", 1 if final_state.get('match_decision') == "Non-Match" else 0)
-            mlflow.log_metric("needs_review", 1 if final_state.get('match_decision') == "Review Required" else 0)
-            mlflow.log_metric("age_mismatch", 1 if final_state.get('match_decision') == "Age Mismatch - Needs Verification" else 0)
-
-            # Log sentiment metrics (for tracking sentiment distribution)
-            sentiment_value = final_state.get('sentiment', 'N/A')
-            mlflow.log_metric("sentiment_negative", 1 if sentiment_value == "Negative" else 0)
-            mlflow.log_metric("sentiment_positive", 1 if sentiment_value == "Positive" else 0)
-            mlflow.log_metric("sentiment_neutral", 1 if sentiment_value == "Neutral" else 0)
-
-            # Log execution performance metrics
-            mlflow.log_metric("total_execution_time_seconds", total_execution_time)
-            mlflow.log_metric("total_nodes_executed", total_nodes_executed)
-            mlflow.log_metric("article_text_length", len(final_state.get('article_text', '')))
-
-            # Log token usage metrics
-            token_usage = final_state.get('token_usage', {})
-            total_prompt_tokens = 0
-            total_completion_tokens = 0
-            total_tokens = 0
-
-            for node_name, usage in token_usage.items():
-                # Log per-node token metrics
-                mlflow.log_metric(f"tokens_{node_name}_prompt", usage.get('prompt_tokens', 0))
-                mlflow.log_metric(f"tokens_{node_name}_completion", usage.get('completion_tokens', 0))
-                mlflow.log_metric(f"tokens_{node_name}_total", usage.get('total_tokens', 0))
-
-                # Accumulate totals
-                total_prompt_tokens += usage.get('prompt_tokens', 0)
-                total_completion_tokens += usage.get('completion_tokens', 0)
-                total_tokens += usage.get('total_tokens', 0)
-
-            # Log total token usage across all LLM calls
-            mlflow.log_metric("tokens_total_prompt", total_prompt_tokens)
-            mlflow.log_metric("tokens_total_completion", total_completion_tokens)
-            mlflow.log_metric("tokens_total_all", total_tokens)
-
-            # Track if LLM call was skipped for name check (cost optimization)
-            llm_calls_made = len(token_usage)
-            name_check_skipped = 'check_name_presence' not in token_usage and not final_state.get('name_is_present', False)
-            mlflow.log_metric("llm_calls_made", llm_calls_made)
-            mlflow.log_metric("name_check_llm_skipped", 1 if name_check_skipped else 0)
-
-            if name_check_skipped:
-                logger.info("Quick name check: LLM call SKIPPED (name not found via keyword search)")
-                logger.info(f"LLM Calls Made: {llm_calls_made}/4 (saved 1 call)")
-            else:
-                logger.info(f"LLM Calls Made: {llm_calls_made}")
-
-            logger.info(f"Total Token Usage: {total_prompt_tokens} prompt + {total_completion_tokens} completion = {total_tokens} total")
-
-            # Log explanations as parameters (truncate to avoid size limits)
-            mlflow.log_param("name_check_explanation", final_state.get('name_check_explanation', '')[:500])
-            mlflow.log_param("age_check_explanation", final_state.get('age_check_explanation', '')[:500])
-            mlflow.log_param("match_explanation", final_state.get('match_explanation', '')[:500])
-            mlflow.log_param("sentiment_explanation", final_state.get('sentiment_explanation', '')[:500])
-
-            # Log artifacts
-            mlflow.log_text(final_state.get('article_text', ''), "article_text.txt")
-            mlflow.log_dict(state_history, "run_state_history.json")
-            mlflow.log_dict(final_state, "final_state.json")
-            mlflow.log_dict(node_execution_times, "node_execution_times.json")
-            mlflow.log_dict(token_usage, "token_usage.json")
-
-            # Create and log execution summary
-            execution_summary = {
-                "run_id": run_id,
-                "run_name": run_name,
-                "applicant_name": case['name'],
-                "applicant_dob": case['dob'],
-                "article_url": case['url'],
-                "match_decision": final_state.get('match_decision'),
-                "sentiment": final_state.get('sentiment'),
-                "name_is_present": final_state.get('name_is_present'),
-                "age_matches": final_state.get('age_matches'),
-                "total_execution_time_seconds": round(total_execution_time, 2),
-                "total_nodes_executed": total_nodes_executed,
-                "total_tokens_used": total_tokens,
-                "total_prompt_tokens": total_prompt_tokens,
-                "total_completion_tokens": total_completion_tokens,
-                "execution_timestamp": datetime.now().isoformat()
-            }
-            mlflow.log_dict(execution_summary, "execution_summary.json")
-
-            logger.info(f"Total Execution Time: {total_execution_time:.2f}s")
-            logger.info(f"MLflow Run {run_id} Finished")
-            logger.info("=" * 50)
-
-        except Exception as e:
-            total_execution_time = time.time() - start_time
-
-            logger.error(f"Graph execution FAILED: {e}", exc_info=True)
-
-            # Log error details
-            mlflow.set_tag("status", "FAILED")
-            mlflow.set_tag("error_type", type(e).__name__)
-            mlflow.log_param("error_message", str(e)[:500])
-
-            # Log execution metrics even on failure
-            mlflow.log_metric("total_execution_time_seconds", total_execution_time)
-            mlflow.log_metric("total_nodes_executed", step_counter)
-            mlflow.log_metric("execution_failed", 1)
-
-            # Log partial results
-            if state_history:
-                mlflow.log_dict(state_history, "partial_state_history.json")
-            if current_state:
-                mlflow.log_dict(current_state, "partial_final_state.json")
-
-            # Create error summary
-            error_summary = {
-                "run_id": run_id,
-                "error_type": type(e).__name__,
-                "error_message": str(e),
-                "failed_at_step": step_counter,
-                "execution_time_before_failure": round(total_execution_time, 2),
-                "timestamp": datetime.now().isoformat()
-            }
-            mlflow.log_dict(error_summary, "error_summary.json")
-
-            logger.error(f"MLflow Run {run_id} Marked as FAILED")
+    Returns:
+        List of test case dictionaries, or None if the article could not be fetched
+    """
+    article_text = fetch_article_text(article_input)
+    if is_fetch_error(article_text):
+        # Scanning the error message would clear every applicant without looking at the article
+        logger.error(f"Watchlist: could not fetch the article, no applicants screened ({article_text})")
+        return None
+
+    watchlist = NameWatchlist(load_watchlist(watchlist_file))
+    candidates = watchlist.scan(article_text)
+    logger.info(f"Watchlist: {len(candidates)} of {len(watchlist)} applicants may be mentioned in the article")
+    return [
+        {"name": applicant["name"], "dob": applicant["dob"], "url": article_input}
+        for applicant in candidates
+    ]
+
+
+def save_graph_image(app) -> None:
+    """
+    Render the workflow graph with Mermaid and save it to graphs/workflow_graph.png.
+
+    Args:
+        app: Compiled LangGraph workflow
+    """
+    try:
+        # Create graphs directory if it doesn't exist
+        graphs_dir = Path("graphs")
+        graphs_dir.mkdir(exist_ok=True)
+
+        # Save as PNG
+        graph_image_path = graphs_dir / "workflow_graph.png"
+        graph = app.get_graph()
+        graph_image = graph.draw_mermaid_png()
+
+        with open(graph_image_path, 'wb') as f:
+            f.write(graph_image)
+
+        logger.info(f"Graph visualization saved to: {graph_image_path}")
+    except Exception as e:
+        logger.warning(f"Could not save graph image: {e}. This requires Mermaid CLI or graphviz to be installed.")
 
 
 def main():
@@ -289,100 +500,102 @@ def main():
     parser.add_argument("--article", type=str, help="URL of the news article to screen OR direct article text")
     parser.add_argument("--text", type=str, help="Direct article text (alternative to --article)")
     parser.add_argument("--test_file", type=str, help="Path to a CSV test file")
+    parser.add_argument("--watchlist", type=str,
+                        help="Path to a CSV of applicants (name, dob) to screen against --article/--text; "
+                             "only applicants whose name may appear in the article are verified")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENT_CASES,
+                        help=f"Maximum number of cases processed concurrently (default: {MAX_CONCURRENT_CASES})")
+    parser.add_argument("--visualize", action="store_true",
+                        help="Log the ASCII graph diagram and save graphs/workflow_graph.png")
+    parser.add_argument("--clear-llm-cache", action="store_true",
+                        help="Empty the persistent LLM response cache (LLM_RESPONSE_CACHE) before running")
 
     args = parser.parse_args()
 
+    import mlflow
+    from src.graph import get_app, warm_up_llm
+    from src.graph.nodes import llm_response_cache
+
+    # Connect to Gemini while MLflow and the graph are being set up
+    threading.Thread(target=warm_up_llm, name="llm-warm-up", daemon=True).start()
+
     # Configure MLflow
     mlflow.set_tracking_uri(MLFLOW_TRACKING_URI)
-    mlflow.set_experiment(MLFLOW_EXPERIMENT_NAME)
+    experiment = mlflow.set_experiment(MLFLOW_EXPERIMENT_NAME)
+
+    # Enable LangChain/LangGraph autologging once per process
+    mlflow.langchain.autolog(silent=True)
     logger.info(f"MLflow tracking enabled. URI: {mlflow.get_tracking_uri()}")
     logger.info(f"Experiment: {MLFLOW_EXPERIMENT_NAME}")
 
+    if args.clear_llm_cache:
+        if llm_response_cache is not None:
+            llm_response_cache.clear()
+            logger.info(f"Cleared LLM response cache: {LLM_RESPONSE_CACHE}")
+        else:
+            logger.warning("--clear-llm-cache given but LLM_RESPONSE_CACHE is not set")
+
     # Build and compile the graph
-    app = build_graph()
+    app = get_app()
     logger.info("Graph compiled successfully")
-    logger.debug("Graph ASCII diagram:")
-    logger.debug(f"\n{app.get_graph().draw_ascii()}")
-
-    # Save graph as image
-    try:
-        from pathlib import Path
-
-        # Create graphs directory if it doesn't exist
-        graphs_dir = Path("graphs")
-        graphs_dir.mkdir(exist_ok=True)
 
-        # Save as PNG
-        graph_image_path = graphs_dir / "workflow_graph.png"
-        graph = app.get_graph()
-        graph_image = graph.draw_mermaid_png()
-
-        with open(graph_image_path, 'wb') as f:
-            f.write(graph_image)
+    # Rendering is slow (draw_mermaid_png may call out to mermaid.ink), so only do it on request
+    if args.visualize:
+        logger.debug("Graph ASCII diagram:")
+        logger.debug(f"\n{app.get_graph().draw_ascii()}")
 
-        logger.info(f"Graph visualization saved to: {graph_image_path}")
-    except Exception as e:
-        logger.warning(f"Could not save graph image: {e}. This requires Mermaid CLI or graphviz to be installed.")
+        # Render the PNG in the background so the cases start right away
+        threading.Thread(target=save_graph_image, args=(app,), name="graph-render").start()
 
-    # Determine test cases to run
-    test_cases_to_run = []
-    if args.test_file:
-        test_cases_to_run.extend(load_test_cases(args.test_file))
+    # Determine test cases to run (CSV rows are read lazily as workers pick them up)
+    if args.watchlist:
+        article_input = args.text if args.text else args.article
+        if not article_input:
+            logger.error("--watchlist requires --article or --text")
+            exit(1)
+        test_cases_to_run = watchlist_cases(args.watchlist, article_input)
+        if test_cases_to_run is None:
+            exit(1)
+    elif args.test_file:
+        test_cases_to_run = load_test_cases(args.test_file)
     elif args.name and args.dob and (args.article or args.text):
         # Use --text if provided, otherwise use --article (which can be URL or text)
         article_input = args.text if args.text else args.article
-        test_cases_to_run.append({
+        test_cases_to_run = [{
             "name": args.name,
             "dob": args.dob,
             "url": article_input  # Can be URL or direct text
-        })
+        }]
     else:
         logger.info(f"No inputs provided. Running with default '{DEFAULT_TEST_CASES_FILE}'")
         if os.path.exists(DEFAULT_TEST_CASES_FILE):
-            test_cases_to_run.extend(load_test_cases(DEFAULT_TEST_CASES_FILE))
+            test_cases_to_run = load_test_cases(DEFAULT_TEST_CASES_FILE)
         else:
             logger.error(f"'{DEFAULT_TEST_CASES_FILE}' not found. Please create it or provide inputs.")
             exit(1)
 
-    logger.info(f"Total test cases to process: {len(test_cases_to_run)}")
-
-    # Run verification for each test case
-    successful_runs = 0
-    failed_runs = 0
-
-    for idx, case in enumerate(test_cases_to_run, 1):
-        if not all(key in case for key in ['name', 'dob', 'url']):
-            logger.warning(f"Skipping invalid case: {case}")
-            failed_runs += 1
-            continue
-
-        logger.info(f"[{idx}/{len(test_cases_to_run)}] Processing case...")
-        try:
-            run_verification(app, case)
-            successful_runs += 1
-
-            # Add delay between cases (except for last case) to ensure independent API sessions
-            if idx < len(test_cases_to_run):
-                logger.debug(f"Waiting {BATCH_PROCESSING_DELAY}s before next case (rate limit protection)")
-                time.sleep(BATCH_PROCESSING_DELAY)
-
-        except Exception as e:
-            logger.error(f"Failed to process case: {e}", exc_info=True)
-            failed_runs += 1
+    # load_test_cases already drops (and counts) invalid rows, so every case can run
+    logger.info(f"Running with concurrency: {args.concurrency}")
+    outcomes = asyncio.run(
+        run_all_verifications(app, test_cases_to_run, experiment.experiment_id, max(1, args.concurrency))
+    )
+    successful_runs = sum(1 for ok in outcomes if ok)
 
-            # Add delay even on failure to prevent cascading rate limit errors
-            if idx < len(test_cases_to_run):
-                logger.debug(f"Waiting {BATCH_PROCESSING_DELAY}s before next case (rate limit protection)")
-                time.sleep(BATCH_PROCESSING_DELAY)
+    logger.info("Waiting for queued MLflow logging to finish...")
+    mlflow_queue.flush()
+    failed_runs = len(outcomes) - successful_runs
+    skipped_rows = getattr(test_cases_to_run, 'skipped_rows', 0)
 
     # Print summary
-    logger.info("=" * 50)
+    logger.info(SEPARATOR)
     logger.info("BATCH EXECUTION SUMMARY")
-    logger.info("=" * 50)
-    logger.info(f"Total cases: {len(test_cases_to_run)}")
+    logger.info(SEPARATOR)
+    logger.info(f"Total cases: {len(outcomes)}")
     logger.info(f"Successful: {successful_runs}")
     logger.info(f"Failed: {failed_runs}")
-    logger.info("=" * 50)
+    if skipped_rows:
+        logger.info(f"Skipped invalid rows: {skipped_rows} (not run; see the warnings above)")
+    logger.info(SEPARATOR)
 
 
 if __name__ == "__main__":
@@ -3,30 +3,66 @@
 from .settings import (
     GOOGLE_API_KEY,
     GEMINI_MODEL_NAME,
+    COMBINED_LLM_ANALYSIS,
+    PARALLEL_SENTIMENT,
+    SENTIMENT_KEYWORD_SHORTCUT,
+    GEMINI_CONTEXT_CACHING,
+    CONTEXT_CACHE_MIN_TOKENS,
+    CONTEXT_CACHE_TTL,
+    LLM_RESPONSE_CACHE,
+    ARTICLE_FOCUS_WINDOW,
+    ARTICLE_MAX_CHARS,
     MLFLOW_TRACKING_URI,
     MLFLOW_EXPERIMENT_NAME,
+    MLFLOW_PER_STEP_ARTIFACTS,
     REQUEST_HEADERS,
     REQUEST_TIMEOUT,
-    DEFAULT_TEST_CASES_FILE
+    MAX_PAGE_BYTES,
+    URL_CACHE_SIZE,
+    ARTICLE_CACHE,
+    DEFAULT_TEST_CASES_FILE,
+    FAST_IO,
+    MAX_CASES_PER_MINUTE,
+    MAX_CONCURRENT_CASES
 )
 
 from .prompts import (
     NAME_PRESENCE_PROMPT,
     AGE_VERIFICATION_PROMPT,
     DETAIL_VERIFICATION_PROMPT,
-    SENTIMENT_ANALYSIS_PROMPT
+    SENTIMENT_ANALYSIS_PROMPT,
+    NEGATIVE_SENTIMENT_TERMS,
+    COMBINED_ANALYSIS_PROMPT
 )
 
 __all__ = [
     'GOOGLE_API_KEY',
     'GEMINI_MODEL_NAME',
+    'COMBINED_LLM_ANALYSIS',
+    'PARALLEL_SENTIMENT',
+    'SENTIMENT_KEYWORD_SHORTCUT',
+    'GEMINI_CONTEXT_CACHING',
+    'CONTEXT_CACHE_MIN_TOKENS',
+    'CONTEXT_CACHE_TTL',
+    'LLM_RESPONSE_CACHE',
+    'ARTICLE_FOCUS_WINDOW',
+    'ARTICLE_MAX_CHARS',
     'MLFLOW_TRACKING_URI',
     'MLFLOW_EXPERIMENT_NAME',
+    'MLFLOW_PER_STEP_ARTIFACTS',
     'REQUEST_HEADERS',
     'REQUEST_TIMEOUT',
+    'MAX_PAGE_BYTES',
+    'URL_CACHE_SIZE',
+    'ARTICLE_CACHE',
     'DEFAULT_TEST_CASES_FILE',
+    'FAST_IO',
+    'MAX_CASES_PER_MINUTE',
+    'MAX_CONCURRENT_CASES',
     'NAME_PRESENCE_PROMPT',
     'AGE_VERIFICATION_PROMPT',
     'DETAIL_VERIFICATION_PROMPT',
-    'SENTIMENT_ANALYSIS_PROMPT'
+    'SENTIMENT_ANALYSIS_PROMPT',
+    'NEGATIVE_SENTIMENT_TERMS',
+    'COMBINED_ANALYSIS_PROMPT'
 ]
@@ -167,3 +167,69 @@ Provide your response in a single, valid JSON object with two keys (response mus
 - "Appointed as CEO of XYZ Corp" → "Neutral" (routine announcement)
 - "Won lawsuit but previously accused of fraud" → "Negative" (fraud accusation is red flag)
 """
+
+# Red-flag terms from the sentiment guidelines above, in the languages of the screened articles.
+# With SENTIMENT_KEYWORD_SHORTCUT=1, an article containing at least two distinct terms is classified
+# Negative without the sentiment LLM call. Terms are lowercase; matching normalizes them like the article
+# text (accents stripped), so Latin-script terms are written without accents.
+NEGATIVE_SENTIMENT_TERMS = (
+    # English
+    "fraud", "embezzlement", "money laundering", "tax evasion", "ponzi", "lawsuit", "indicted",
+    "convicted", "sentenced", "bankruptcy", "insolvency", "bribery", "corruption", "sanctioned",
+    "penalty", "fined", "scandal", "allegations", "investigation", "charged with",
+    # Spanish / Portuguese
+    "fraude", "lavado de dinero", "lavagem de dinheiro", "evasion fiscal", "soborno", "corrupcion",
+    "corrupcao", "quiebra", "falencia", "escandalo", "investigacion", "investigacao", "condenado", "multa",
+    # French / Italian / German
+    "blanchiment", "escroquerie", "faillite", "enquete", "condamne", "amende",
+    "riciclaggio", "truffa", "bancarotta", "corruzione", "indagine", "condannato",
+    "betrug", "geldwasche", "insolvenz", "bestechung", "ermittlungen", "verurteilt",
+    # Russian / Ukrainian
+    "мошенничеств", "шахрайств", "отмывани", "коррупци", "корупці", "банкротств", "расследовани", "розслідуванн",
+    # Chinese / Japanese / Korean / Arabic
+    "欺诈", "诈骗", "洗钱", "腐败", "贿赂", "破产", "丑闻", "调查", "詐欺", "横領", "破産",
+    "사기", "횡령", "파산", "احتيال", "غسيل الأموال", "فساد", "رشوة", "إفلاس",
+)
+
+# --- Combined Analysis Prompt (COMBINED_LLM_ANALYSIS=1) ---
+
+COMBINED_ANALYSIS_PROMPT = """
+You are a meticulous multilingual risk analyst for a financial institution, capable of processing articles in any language.
+You are screening an article for adverse media about a specific applicant and must complete four checks in one pass.
+
+**IMPORTANT**: The article may be in any language (English, Spanish, French, German, Chinese, Arabic, etc.).
+Process the content in its original language and provide your response in English.
+
+Applicant Name: {applicant_name}
+Applicant DOB: {applicant_dob}
+
+Article Text:
+{article_text}
+
+**Check 1 - Name presence:** Is the Applicant Name, or a very clear variation (e.g., "Bill" for "William"), mentioned in the article?
+- Account for transliterations, non-Latin scripts, surname-first order, patronymics, "Al-"/"bin" prefixes and missing accents.
+
+**Check 2 - Age:** Does the age or date of birth mentioned for this person match the Applicant DOB?
+- Allow a margin of error of +/- 1 year and account for different date formats.
+- If NO age or DOB information is found, answer true (benefit of the doubt).
+
+**Check 3 - Identity decision:** Is this the *correct person*? Avoid false negatives.
+- "Match": name and DOB match, or name and other strong identifiers match.
+- "Non-Match": the name is absent, or there is *explicit contradictory evidence* (e.g., a *different* DOB or age).
+- "Review Required": the name matches but no other identifying or contradictory details are present. **This is your default if uncertain.**
+
+**Check 4 - Sentiment:** From a financial risk and regulatory compliance perspective, how does the article portray this person?
+- "Negative": ANY red flag (lawsuits, convictions, fraud, money laundering, investigations, fines, sanctions, bankruptcies, corruption, scandals or allegations), even if positive aspects are also present.
+- "Positive": ONLY if there are no red flags and the content is unequivocally positive (philanthropy, awards, successful ventures).
+- "Neutral": factual content without clear positive/negative. Use "Neutral" when in doubt between Positive/Negative; if uncertain between Negative and Neutral, choose "Negative".
+
+Respond in a single, valid JSON object with these keys (response must be in English):
+- "name_is_present": true or false
+- "name_check_explanation": A brief reason for Check 1.
+- "age_matches": true or false
+- "age_check_explanation": What age information was found and how it compares to the Applicant DOB.
+- "decision": One of "Match", "Non-Match", "Review Required".
+- "explanation": A step-by-step justification for the decision, mentioning the language of the article if not English.
+- "sentiment": One of "Positive", "Negative", "Neutral".
+- "sentiment_explanation": A brief justification citing specific facts from the article.
+"""
@@ -1,9 +1,15 @@
 """Graph package for LangGraph workflow."""
 
-from .state import GraphState
-from .workflow import build_graph
+from .state import GraphState, INITIAL_STATE_DEFAULTS
+from .workflow import build_graph, get_app, size_node_executor
+from .nodes import release_article_context, warm_up_llm
 
 __all__ = [
     'GraphState',
-    'build_graph'
+    'INITIAL_STATE_DEFAULTS',
+    'build_graph',
+    'get_app',
+    'size_node_executor',
+    'release_article_context',
+    'warm_up_llm'
 ]
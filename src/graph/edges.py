@@ -3,8 +3,29 @@ Edge routing logic for the LangGraph workflow.
 Determines which node to execute next based on the current state.
 """
 
+from src.utils import get_logger, is_fetch_error
 from .state import GraphState
 
+# Routing decisions are logged at DEBUG, so they only reach the log file
+logger = get_logger("ArticleVerification.Edges")
+
+
+def should_analyze_article(state: GraphState) -> str:
+    """
+    Router 0: After fetching, end the graph if the article could not be fetched,
+    so no LLM call is spent on the error message.
+
+    Args:
+        state: Current graph state
+
+    Returns:
+        "analyze" or "end"
+    """
+    if is_fetch_error(state["article_text"]):
+        logger.debug("Router 0: article could not be fetched, ending graph (Review Required)")
+        return "end"
+    return "analyze"
+
 
 def should_verify_age(state: GraphState) -> str:
     """
@@ -17,12 +38,11 @@ def should_verify_age(state: GraphState) -> str:
     Returns:
         Next node to execute: "verify_age" or "set_non_match"
     """
-    print("--- Router 1: Checking Name Presence ---")
     if state["name_is_present"]:
-        print("--- Decision: Name Found. Proceed to Verify Age. ---")
+        logger.debug("Router 1: name found, proceeding to verify_age")
         return "verify_age"
     else:
-        print("--- Decision: Name Not Found. End Graph (Non-Match). ---")
+        logger.debug("Router 1: name not found, ending graph (Non-Match)")
         return "set_non_match"
 
 
@@ -37,12 +57,11 @@ def should_verify_details(state: GraphState) -> str:
     Returns:
         Next node to execute: "verify_details" or "set_age_mismatch"
     """
-    print("--- Router 2: Checking Age Match ---")
     if state["age_matches"]:
-        print("--- Decision: Age Matches. Proceed to Verify Details. ---")
+        logger.debug("Router 2: age matches, proceeding to verify_details")
         return "verify_details"
     else:
-        print("--- Decision: Age Mismatch. Mark for Further Verification. ---")
+        logger.debug("Router 2: age mismatch, marking for further verification")
         return "set_age_mismatch"
 
 
@@ -57,12 +76,11 @@ def should_assess_sentiment(state: GraphState) -> str:
     Returns:
         Next node to execute: "assess_sentiment" or "end"
     """
-    print("--- Router 3: Checking Match Decision ---")
     decision = state["match_decision"]
 
     if decision == "Match" or decision == "Review Required":
-        print("--- Decision: Proceed to Sentiment Analysis ---")
+        logger.debug("Router 3: decision %s, proceeding to assess_sentiment", decision)
         return "assess_sentiment"
     else:  # "Non-Match"
-        print("--- Decision: End Graph (Contradictory Details) ---")
+        logger.debug("Router 3: decision %s, ending graph (contradictory details)", decision)
         return "end"
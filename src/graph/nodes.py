@@ -3,49 +3,171 @@ LangGraph nodes for the Article Person Verification workflow.
 Each node represents a step in the verification process.
 """
 
-import json
+import re
 import time
+import random
+import hashlib
+import threading
+from functools import lru_cache
+from typing import Optional
 import google.generativeai as genai
 from google.api_core import exceptions as google_exceptions
 from src.config import (
     GOOGLE_API_KEY,
     GEMINI_MODEL_NAME,
+    GEMINI_CONTEXT_CACHING,
+    CONTEXT_CACHE_MIN_TOKENS,
+    CONTEXT_CACHE_TTL,
+    LLM_RESPONSE_CACHE,
+    ARTICLE_FOCUS_WINDOW,
+    ARTICLE_MAX_CHARS,
+    SENTIMENT_KEYWORD_SHORTCUT,
     NAME_PRESENCE_PROMPT,
     AGE_VERIFICATION_PROMPT,
     DETAIL_VERIFICATION_PROMPT,
-    SENTIMENT_ANALYSIS_PROMPT
+    SENTIMENT_ANALYSIS_PROMPT,
+    COMBINED_ANALYSIS_PROMPT
 )
-from src.utils import fetch_article_text, quick_name_check, get_logger
+from src.utils import fetch_article_text, is_fetch_error, focus_article_text, cap_article_text, quick_name_check, find_negative_terms, get_logger, loads_json, LLMResponseCache
 from .state import GraphState
 
 # Configure the Gemini API globally
 genai.configure(api_key=GOOGLE_API_KEY)
 
+# GenerativeModel only holds the model name and defaults (the transport is the SDK's shared client),
+# so one instance serves every call and thread
+model = genai.GenerativeModel(GEMINI_MODEL_NAME)
+
 # Get logger for nodes
 logger = get_logger("ArticleVerification.Nodes")
 
+# Server-side errors worth retrying: rate limits and transient 5xx/timeouts
+TRANSIENT_LLM_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.TooManyRequests,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.GatewayTimeout,
+    google_exceptions.DeadlineExceeded
+)
+
+# Rate-limit errors mean the whole project is over quota, not just one request
+RATE_LIMIT_ERRORS = (google_exceptions.ResourceExhausted, google_exceptions.TooManyRequests)
+
+# Monotonic time until which no thread should send a request, pushed forward by every rate-limit error
+# so concurrent cases wait out the same backoff window instead of retrying into the limit one by one
+_rate_limit_until = 0.0
+_rate_limit_lock = threading.Lock()
+
+# Responses persisted between runs (LLM_RESPONSE_CACHE), or None when disabled
+llm_response_cache = LLMResponseCache(LLM_RESPONSE_CACHE) if LLM_RESPONSE_CACHE else None
+
+# Stands in for the article in prompts whose article_text lives in a Gemini context cache
+ARTICLE_IN_CONTEXT = "(The article text is provided in the cached context above.)"
+
+# {field} placeholders in the prompt templates
+PROMPT_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+# Context caches created by this process, by name, so calls can reuse them without a lookup request
+_article_contexts = {}
+
+# Clears a sentiment assessed in parallel (PARALLEL_SENTIMENT) once the case ends without a match;
+# in the sequential workflow these are already the defaults
+NO_SENTIMENT = {"sentiment": "N/A", "sentiment_explanation": ""}
+
+
+def json_response_config(properties: dict) -> dict:
+    """
+    Build a Gemini generation config that makes the model answer with bare JSON
+    holding exactly the given keys, so responses parse without any cleanup.
+
+    Args:
+        properties: Response schema properties by key (all of them required)
+
+    Returns:
+        Generation config dict for generate_content
+    """
+    return {
+        "response_mime_type": "application/json",
+        "response_schema": {"type": "object", "properties": properties, "required": list(properties)},
+    }
+
 
-def get_fresh_model():
+# Structured output for each LLM node, matching the keys its prompt asks for
+NAME_PRESENCE_CONFIG = json_response_config({
+    "name_is_present": {"type": "boolean"},
+    "explanation": {"type": "string"},
+})
+AGE_VERIFICATION_CONFIG = json_response_config({
+    "age_matches": {"type": "boolean"},
+    "explanation": {"type": "string"},
+})
+DETAIL_VERIFICATION_CONFIG = json_response_config({
+    "decision": {"type": "string", "enum": ["Match", "Non-Match", "Review Required"]},
+    "explanation": {"type": "string"},
+})
+SENTIMENT_ANALYSIS_CONFIG = json_response_config({
+    "sentiment": {"type": "string", "enum": ["Positive", "Negative", "Neutral"]},
+    "explanation": {"type": "string"},
+})
+COMBINED_ANALYSIS_CONFIG = json_response_config({
+    "name_is_present": {"type": "boolean"},
+    "name_check_explanation": {"type": "string"},
+    "age_matches": {"type": "boolean"},
+    "age_check_explanation": {"type": "string"},
+    "decision": {"type": "string", "enum": ["Match", "Non-Match", "Review Required"]},
+    "explanation": {"type": "string"},
+    "sentiment": {"type": "string", "enum": ["Positive", "Negative", "Neutral"]},
+    "sentiment_explanation": {"type": "string"},
+})
+
+
+def get_model(cached_content: Optional[str] = None):
     """
-    Create a fresh model instance for each API call.
-    This helps treat each call as independent and reduces rate limiting issues.
+    Return the model to call: the shared instance, or one bound to an article context cache.
+
+    Args:
+        cached_content: Optional name of a context cache the model should read from
 
     Returns:
-        A new GenerativeModel instance
+        A GenerativeModel instance
     """
-    return genai.GenerativeModel(GEMINI_MODEL_NAME)
+    if cached_content:
+        return genai.GenerativeModel.from_cached_content(_article_contexts.get(cached_content, cached_content))
+    return model
 
 
-def call_llm_with_retry(prompt: str, max_retries: int = 5, initial_delay: float = 3.0, inter_call_delay: float = 2.0) -> tuple:
+def warm_up_llm() -> None:
     """
-    Call the LLM with exponential backoff retry logic for rate limiting.
-    Creates a fresh model instance for each call to simulate independent requests.
+    Open the Gemini client connection before the first case needs it.
+
+    Sends a count_tokens request, which is not billed, so the channel, TLS handshake and
+    authentication are set up off the first node's critical path. Failures are only
+    logged; the first real call will surface them.
+    """
+    try:
+        model.count_tokens("ping")
+        logger.debug("Gemini client warmed up")
+    except Exception as e:
+        logger.debug(f"Gemini warm-up failed: {e}")
+
+
+def call_llm_with_retry(prompt: str, max_retries: int = 5, initial_delay: float = 3.0, inter_call_delay: float = 0.0,
+                        generation_config: Optional[dict] = None, cached_content: Optional[str] = None) -> tuple:
+    """
+    Call the LLM with exponential backoff retry logic for rate limits and transient server errors
+    (5xx, timeouts). Backoff delays are jittered so concurrent cases do not retry in lockstep.
+    A rate-limit backoff is shared: every thread holds its next request until it has passed.
+    All calls go through the SDK's process-wide client, so connections are reused.
 
     Args:
         prompt: The prompt to send to the LLM
         max_retries: Maximum number of retry attempts (increased to 5)
         initial_delay: Initial delay in seconds before first retry (3s)
-        inter_call_delay: Delay after each successful call (2s)
+        inter_call_delay: Optional delay after each successful call (off by default: request rates are
+            bounded by the case rate limiter, and 429s by the backoff below)
+        generation_config: Optional Gemini generation config (e.g. a JSON response schema)
+        cached_content: Optional name of the context cache holding the article
 
     Returns:
         Tuple of (response_text, usage_metadata dict)
@@ -56,80 +178,287 @@ def call_llm_with_retry(prompt: str, max_retries: int = 5, initial_delay: float
     """
     delay = initial_delay
 
+    global _rate_limit_until
+
     for attempt in range(max_retries):
+        # Wait out a rate-limit backoff started by any thread
+        remaining = _rate_limit_until - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
         try:
-            # Create a fresh model instance for each call
-            fresh_model = get_fresh_model()
-            response = fresh_model.generate_content(prompt)
+            response = get_model(cached_content).generate_content(prompt, generation_config=generation_config)
 
             # Extract token usage metadata
             usage_metadata = {
                 "prompt_tokens": 0,
                 "completion_tokens": 0,
-                "total_tokens": 0
+                "total_tokens": 0,
+                "cached_tokens": 0
             }
 
             if hasattr(response, 'usage_metadata'):
                 usage_metadata = {
                     "prompt_tokens": getattr(response.usage_metadata, 'prompt_token_count', 0),
                     "completion_tokens": getattr(response.usage_metadata, 'candidates_token_count', 0),
-                    "total_tokens": getattr(response.usage_metadata, 'total_token_count', 0)
+                    "total_tokens": getattr(response.usage_metadata, 'total_token_count', 0),
+                    "cached_tokens": getattr(response.usage_metadata, 'cached_content_token_count', 0)
                 }
                 logger.debug(f"Tokens: {usage_metadata['prompt_tokens']} prompt + {usage_metadata['completion_tokens']} completion = {usage_metadata['total_tokens']} total")
 
-            # Add delay after successful call to avoid rapid successive requests
-            time.sleep(inter_call_delay)
+            # Optional delay after a successful call to space out successive requests
+            if inter_call_delay:
+                time.sleep(inter_call_delay)
 
             return response.text, usage_metadata
         except Exception as e:
             error_message = str(e)
 
-            # Check if it's a rate limit error (429)
-            if "429" in error_message or "quota" in error_message.lower() or "rate" in error_message.lower():
+            # Check if it's a rate limit error (by type, or a 429/quota message from an untyped error)
+            # or a transient server error
+            is_rate_limit = (isinstance(e, RATE_LIMIT_ERRORS) or "429" in error_message
+                             or "quota" in error_message.lower())
+            if is_rate_limit or isinstance(e, TRANSIENT_LLM_ERRORS):
                 if attempt < max_retries - 1:
-                    logger.warning(f"Rate limit hit. Waiting {delay:.1f}s before retry {attempt + 1}/{max_retries - 1}")
-                    time.sleep(delay)
+                    wait = delay * random.uniform(0.5, 1.5)
+                    logger.warning(f"{type(e).__name__}: waiting {wait:.1f}s before retry {attempt + 1}/{max_retries - 1}")
+                    # A rate limit applies to the whole project: hold back every thread's next request, not just this one
+                    if is_rate_limit:
+                        with _rate_limit_lock:
+                            _rate_limit_until = max(_rate_limit_until, time.monotonic() + wait)
+                    else:
+                        time.sleep(wait)
                     delay *= 2  # Exponential backoff: 3s -> 6s -> 12s -> 24s -> 48s
                 else:
-                    logger.error("Max retries exhausted. Rate limit error persists.")
-                    logger.error("Consider increasing BATCH_PROCESSING_DELAY in settings.py")
-                    raise Exception(f"Rate limit exceeded after {max_retries} attempts: {error_message}")
+                    logger.error("Max retries exhausted. Rate limit or server error persists.")
+                    logger.error("Consider lowering MAX_CASES_PER_MINUTE or MAX_CONCURRENT_CASES in settings.py")
+                    raise Exception(f"LLM call failed after {max_retries} attempts: {error_message}")
             else:
-                # For non-rate-limit errors, raise immediately
+                # For other errors (bad request, auth, safety blocks), raise immediately
                 raise e
 
     raise Exception(f"Failed after {max_retries} attempts")
 
 
-def fetch_article_node(state: GraphState) -> dict:
+def call_llm_cached(prompt: str, node_name: str, article_cache: Optional[dict] = None,
+                    generation_config: Optional[dict] = None, cached_content: Optional[str] = None) -> tuple:
     """
-    Node to fetch the article text from the URL.
+    Call the LLM, reusing a previous response for an identical prompt if cached.
+
+    Prompts embed the full article text, so the content hash of the prompt identifies
+    the (article, applicant) pair. Datasets that reuse the same article skip the repeat calls.
+    With LLM_RESPONSE_CACHE set, responses are also persisted on disk and reused by later runs.
+
+    Args:
+        prompt: The prompt to send to the LLM
+        node_name: Name of the calling node (part of the cache key)
+        article_cache: Shared cache dict, or None to skip the in-memory cache
+        generation_config: Optional Gemini generation config passed through to the call
+        cached_content: Optional name of the context cache holding the article. Prompts sent
+            against a cache no longer contain the article, so the cache name is part of the key.
+
+    Returns:
+        Tuple of (response_text, usage_metadata dict). usage_metadata is None on a cache hit.
+    """
+    # A prompt sent against a context cache does not contain the article, so it is not persisted
+    response_cache = llm_response_cache if cached_content is None else None
+    if article_cache is None and response_cache is None:
+        return call_llm_with_retry(prompt, generation_config=generation_config, cached_content=cached_content)
+
+    key = (node_name, hashlib.sha1(prompt.encode('utf-8')).hexdigest(), cached_content)
+    if article_cache is not None:
+        cached_response = article_cache.get(key)
+        if cached_response is not None:
+            logger.info(f"Cache hit for {node_name} (skipping LLM call)")
+            return cached_response, None
+
+    disk_key = None
+    if response_cache is not None:
+        disk_key = LLMResponseCache.make_key(GEMINI_MODEL_NAME, node_name, str(generation_config), prompt)
+        cached_response = response_cache.get(disk_key)
+        if cached_response is not None:
+            logger.info(f"Disk cache hit for {node_name} (skipping LLM call)")
+            if article_cache is not None:
+                article_cache[key] = cached_response
+            return cached_response, None
+
+    response_text, usage_metadata = call_llm_with_retry(prompt, generation_config=generation_config, cached_content=cached_content)
+    if article_cache is not None:
+        article_cache[key] = response_text
+    if disk_key is not None:
+        response_cache.set(disk_key, response_text)
+    return response_text, usage_metadata
+
+
+def open_article_context(state: GraphState) -> dict:
+    """
+    Upload the article as a Gemini context cache when GEMINI_CONTEXT_CACHING is on and the
+    article is long enough to be cached, so the following LLM calls only send their instructions.
+
+    An API error while creating the cache (e.g. quota, article below the model's minimum) is not
+    fatal; the calls then send the article inline.
 
     Args:
         state: Current graph state
 
     Returns:
-        Updated state with article_text
+        Partial state update with article_context, or an empty dict if no cache was created
+    """
+    if not GEMINI_CONTEXT_CACHING or state.get('article_context'):
+        return {}
+
+    # Roughly 4 characters per token; saves a count_tokens request for articles far below the minimum
+    if len(state['article_text']) < CONTEXT_CACHE_MIN_TOKENS * 4:
+        return {}
+
+    try:
+        context = genai.caching.CachedContent.create(
+            model=GEMINI_MODEL_NAME,
+            contents=[f"Article Text:\n{state['article_text']}"],
+            ttl=CONTEXT_CACHE_TTL
+        )
+    except google_exceptions.GoogleAPIError as e:
+        logger.warning(f"Could not cache the article context, sending it inline instead: {e}")
+        return {}
+
+    _article_contexts[context.name] = context
+    logger.info(f"Article cached as context {context.name}")
+    return {"article_context": context.name}
+
+
+def release_article_context(state: dict) -> None:
+    """
+    Delete the run's Gemini context cache, if one was created. Call once the run has finished.
+
+    Args:
+        state: Final (or partial) state of the run
     """
+    name = state.get('article_context')
+    if not name:
+        return
+
+    context = _article_contexts.pop(name, None)
     try:
-        url_display = state['article_url'][:100] if len(state['article_url']) > 100 else state['article_url']
-        logger.info(f"Node: Fetching Article from {url_display}")
-    except UnicodeEncodeError:
-        logger.info("Node: Fetching Article [contains non-ASCII characters]")
-    text = fetch_article_text(state['article_url'])
+        (context or genai.caching.CachedContent.get(name)).delete()
+    except google_exceptions.GoogleAPIError as e:
+        logger.warning(f"Could not delete context cache {name} (it expires after {CONTEXT_CACHE_TTL}): {e}")
+
+
+@lru_cache(maxsize=None)
+def split_prompt_template(template: str) -> tuple:
+    """
+    Split a prompt template once into alternating literal text and field names.
+
+    Args:
+        template: Prompt template with plain {field} placeholders
+
+    Returns:
+        Tuple with literals at even indexes and field names at odd indexes
+    """
+    return tuple(PROMPT_PLACEHOLDER.split(template))
+
+
+def format_article_prompt(template: str, article_text: str, article_context: str, **fields) -> str:
+    """
+    Fill a prompt template, leaving the article out when it is already in the context cache.
+
+    The template is split into pieces once and joined on every call, which is several
+    times faster than str.format when the article is long. Templates therefore use plain
+    {field} placeholders only (no format specs or escaped braces).
+
+    Args:
+        template: Prompt template with an {article_text} placeholder
+        article_text: Article body
+        article_context: Name of the run's context cache, or "" if the article is not cached
+        **fields: Remaining template fields
+
+    Returns:
+        The formatted prompt
+    """
+    fields['article_text'] = ARTICLE_IN_CONTEXT if article_context else article_text
+    return ''.join(
+        part if i % 2 == 0 else str(fields[part])
+        for i, part in enumerate(split_prompt_template(template))
+    )
+
+
+def track_llm_usage(node_name: str, usage_metadata: Optional[dict]) -> dict:
+    """
+    Build the state updates that account for one LLM step.
+
+    A real call records its token usage under the node name and adds its tokens
+    to the running total_tokens count. A call answered from the cache
+    (usage_metadata is None) is counted in skipped_calls instead.
+    The GraphState reducers add these to the run's totals.
+
+    Args:
+        node_name: Name of the node that made the call
+        usage_metadata: Token usage of the call, or None if it was skipped
+
+    Returns:
+        Partial state update with token_usage and total_tokens, or skipped_calls
+    """
+    if usage_metadata is None:
+        return {"skipped_calls": 1}
+
+    return {
+        "token_usage": {node_name: usage_metadata},
+        "total_tokens": usage_metadata.get('total_tokens', 0)
+    }
+
+
+def fetch_article_node(state: GraphState, article_cache: Optional[dict] = None) -> dict:
+    """
+    Node to fetch the article text from the URL.
+
+    Args:
+        state: Current graph state
+        article_cache: Optional shared cache of fetched articles keyed by input hash
+
+    Returns:
+        Updated state with article_text (trimmed to the passages around the name when
+        ARTICLE_FOCUS_WINDOW is set, and to ARTICLE_MAX_CHARS characters when that is set).
+        If the article cannot be fetched, article_text holds the error and the case is
+        marked Review Required.
+    """
+    url_display = state['article_url'][:100] if len(state['article_url']) > 100 else state['article_url']
+    logger.info(f"Node: Fetching Article from {url_display}")
+    if article_cache is None:
+        text = fetch_article_text(state['article_url'])
+    else:
+        key = ("fetch_article", hashlib.sha1(state['article_url'].encode('utf-8')).hexdigest())
+        text = article_cache.get(key)
+        if text is None:
+            text = fetch_article_text(state['article_url'])
+            if not is_fetch_error(text):
+                article_cache[key] = text
+
+    # The graph ends here on a fetch error (Router 0), leaving the case for manual review
+    if is_fetch_error(text):
+        return {
+            "article_text": text,
+            "match_decision": "Review Required",
+            "match_explanation": f"{text} No LLM checks were run; manual review needed."
+        }
+
+    if ARTICLE_FOCUS_WINDOW:
+        text = focus_article_text(text, state['applicant_name'], ARTICLE_FOCUS_WINDOW)
+    if ARTICLE_MAX_CHARS:
+        text = cap_article_text(text, ARTICLE_MAX_CHARS)
     return {"article_text": text}
 
 
-def check_name_presence_node(state: GraphState) -> dict:
+def check_name_presence_node(state: GraphState, article_cache: Optional[dict] = None) -> dict:
     """
     Node 1 (LLM Call 1): Checks if the applicant's name or variation is present.
     Uses a 3-tier approach:
-    1. Exact match (regex) → Skip LLM, name is present
-    2. Partial match → Call LLM to verify variations/nicknames
+    1. Exact match (full name or variant) → Skip LLM, name is present
+    2. Partial match, or a non-Latin script article → Call LLM to verify variations/transliterations
     3. No match → Skip LLM, name not present
 
     Args:
         state: Current graph state
+        article_cache: Optional shared LLM response cache
 
     Returns:
         Updated state with name_is_present and name_check_explanation
@@ -144,7 +473,9 @@ def check_name_presence_node(state: GraphState) -> dict:
         logger.info(f"✓ Quick name check: EXACT match found for '{state['applicant_name']}' (skipping LLM call)")
         return {
             "name_is_present": True,
-            "name_check_explanation": f"Exact match: '{state['applicant_name']}' found directly in article text via regex. LLM call skipped for efficiency."
+            "name_check_explanation": f"Exact match: '{state['applicant_name']}' (or a nickname/word-order variant) found directly in article text. LLM call skipped for efficiency.",
+            "skipped_calls": 1,
+            **open_article_context(state)
         }
 
     # Case 2: NO MATCH - Name not found at all
@@ -152,70 +483,83 @@ def check_name_presence_node(state: GraphState) -> dict:
         logger.info(f"✗ Quick name check: NO match found for '{state['applicant_name']}' (skipping LLM call)")
         return {
             "name_is_present": False,
-            "name_check_explanation": f"No match: '{state['applicant_name']}' or significant name parts not found in article. LLM call skipped for efficiency."
+            "name_check_explanation": f"No match: '{state['applicant_name']}' or significant name parts not found in article. LLM call skipped for efficiency.",
+            "skipped_calls": 1,
+            "name_check_skipped": True
         }
 
-    # Case 3: PARTIAL MATCH - Name parts found, need LLM to verify variations/nicknames
-    logger.info(f"⚠ Quick name check: PARTIAL match found for '{state['applicant_name']}' (calling LLM to verify variations)")
-
-    prompt = NAME_PRESENCE_PROMPT.format(
-        applicant_name=state['applicant_name'],
-        article_text=state['article_text']
+    # Case 3: PARTIAL MATCH - Name parts found (or a non-Latin article), need LLM to verify variations/transliterations
+    if confidence_level == "script":
+        logger.info(f"⚠ Quick name check: no Latin match for '{state['applicant_name']}' in non-Latin script article (calling LLM to check transliterations)")
+    else:
+        logger.info(f"⚠ Quick name check: PARTIAL match found for '{state['applicant_name']}' (calling LLM to verify variations)")
+
+    # The age and detail checks usually follow, so the article context is cached before the first call
+    context_update = open_article_context(state)
+    article_context = context_update.get('article_context', state.get('article_context', ''))
+
+    prompt = format_article_prompt(
+        NAME_PRESENCE_PROMPT,
+        state['article_text'],
+        article_context,
+        applicant_name=state['applicant_name']
     )
 
     try:
-        response_text, usage_metadata = call_llm_with_retry(prompt)
-        cleaned_response = response_text.strip().lstrip('```json').rstrip('```').strip()
-        data = json.loads(cleaned_response)
-
-        # Update token usage tracking
-        token_usage = state.get('token_usage', {})
-        token_usage['check_name_presence'] = usage_metadata
+        response_text, usage_metadata = call_llm_cached(
+            prompt, 'check_name_presence', article_cache,
+            generation_config=NAME_PRESENCE_CONFIG, cached_content=article_context or None
+        )
+        data = loads_json(response_text)
 
         return {
             "name_is_present": data.get("name_is_present", False),
             "name_check_explanation": data.get("explanation", "Error in parsing response."),
-            "token_usage": token_usage
+            **track_llm_usage('check_name_presence', usage_metadata),
+            **context_update
         }
     except Exception as e:
         logger.error(f"Error in check_name_presence_node: {e}", exc_info=True)
         return {
             "name_is_present": False,
-            "name_check_explanation": f"LLM call or JSON parsing failed: {e}. Defaulting to 'name not present'."
+            "name_check_explanation": f"LLM call or JSON parsing failed: {e}. Defaulting to 'name not present'.",
+            **context_update
         }
 
 
-def verify_age_node(state: GraphState) -> dict:
+def verify_age_node(state: GraphState, article_cache: Optional[dict] = None) -> dict:
     """
     Node 2 (LLM Call 2): Verifies if the age/DOB mentioned in the article matches.
 
     Args:
         state: Current graph state
+        article_cache: Optional shared LLM response cache
 
     Returns:
         Updated state with age_matches and age_check_explanation
     """
     logger.info("Node: Verifying Age")
 
-    prompt = AGE_VERIFICATION_PROMPT.format(
+    article_context = state.get('article_context', '')
+    prompt = format_article_prompt(
+        AGE_VERIFICATION_PROMPT,
+        state['article_text'],
+        article_context,
         applicant_name=state['applicant_name'],
-        applicant_dob=state['applicant_dob'],
-        article_text=state['article_text']
+        applicant_dob=state['applicant_dob']
     )
 
     try:
-        response_text, usage_metadata = call_llm_with_retry(prompt)
-        cleaned_response = response_text.strip().lstrip('```json').rstrip('```').strip()
-        data = json.loads(cleaned_response)
-
-        # Update token usage tracking
-        token_usage = state.get('token_usage', {})
-        token_usage['verify_age'] = usage_metadata
+        response_text, usage_metadata = call_llm_cached(
+            prompt, 'verify_age', article_cache,
+            generation_config=AGE_VERIFICATION_CONFIG, cached_content=article_context or None
+        )
+        data = loads_json(response_text)
 
         return {
             "age_matches": data.get("age_matches", True),
             "age_check_explanation": data.get("explanation", "Error in parsing response."),
-            "token_usage": token_usage
+            **track_llm_usage('verify_age', usage_metadata)
         }
     except Exception as e:
         logger.error(f"Error in verify_age_node: {e}", exc_info=True)
@@ -238,41 +582,46 @@ def set_age_mismatch_node(state: GraphState) -> dict:
     logger.info("Node: Setting Age Mismatch (Needs Verification)")
     return {
         "match_decision": "Age Mismatch - Needs Verification",
-        "match_explanation": state["age_check_explanation"]
+        "match_explanation": state["age_check_explanation"],
+        **NO_SENTIMENT
     }
 
 
-def verify_details_node(state: GraphState) -> dict:
+def verify_details_node(state: GraphState, article_cache: Optional[dict] = None) -> dict:
     """
     Node 3 (LLM Call 3): Verifies details (DOB, etc.) after name and age were confirmed.
 
     Args:
         state: Current graph state
+        article_cache: Optional shared LLM response cache
 
     Returns:
         Updated state with match_decision and match_explanation
     """
     logger.info("Node: Verifying Details")
 
-    prompt = DETAIL_VERIFICATION_PROMPT.format(
+    article_context = state.get('article_context', '')
+    prompt = format_article_prompt(
+        DETAIL_VERIFICATION_PROMPT,
+        state['article_text'],
+        article_context,
         applicant_name=state['applicant_name'],
-        applicant_dob=state['applicant_dob'],
-        article_text=state['article_text']
+        applicant_dob=state['applicant_dob']
     )
 
     try:
-        response_text, usage_metadata = call_llm_with_retry(prompt)
-        cleaned_response = response_text.strip().lstrip('```json').rstrip('```').strip()
-        data = json.loads(cleaned_response)
-
-        # Update token usage tracking
-        token_usage = state.get('token_usage', {})
-        token_usage['verify_details'] = usage_metadata
+        response_text, usage_metadata = call_llm_cached(
+            prompt, 'verify_details', article_cache,
+            generation_config=DETAIL_VERIFICATION_CONFIG, cached_content=article_context or None
+        )
+        data = loads_json(response_text)
 
+        decision = data.get("decision", "Review Required")
         return {
-            "match_decision": data.get("decision", "Review Required"),
+            "match_decision": decision,
             "match_explanation": data.get("explanation", "Error in parsing response."),
-            "token_usage": token_usage
+            **track_llm_usage('verify_details', usage_metadata),
+            **(NO_SENTIMENT if decision == "Non-Match" else {})
         }
     except Exception as e:
         logger.error(f"Error in verify_details_node: {e}", exc_info=True)
@@ -295,40 +644,66 @@ def set_name_non_match_node(state: GraphState) -> dict:
     logger.info("Node: Setting Non-Match (Name Not Found)")
     return {
         "match_decision": "Non-Match",
-        "match_explanation": state["name_check_explanation"]
+        "match_explanation": state["name_check_explanation"],
+        **NO_SENTIMENT
     }
 
 
-def assess_sentiment_node(state: GraphState) -> dict:
+def assess_sentiment_node(state: GraphState, article_cache: Optional[dict] = None, skip_without_name: bool = False) -> dict:
     """
     Node 4 (LLM Call 4): Assesses the article's sentiment about the applicant.
+    With SENTIMENT_KEYWORD_SHORTCUT set, articles with two or more distinct red-flag
+    terms are classified Negative without the LLM call.
 
     Args:
         state: Current graph state
+        article_cache: Optional shared LLM response cache
+        skip_without_name: Skip the call when the quick name check finds no name parts or the
+            article could not be fetched. Used when sentiment runs in parallel with the name check
+            instead of after a confirmed match.
 
     Returns:
         Updated state with sentiment and sentiment_explanation
     """
     logger.info("Node: Assessing Sentiment")
 
-    prompt = SENTIMENT_ANALYSIS_PROMPT.format(
-        applicant_name=state['applicant_name'],
-        article_text=state['article_text']
+    if skip_without_name:
+        if is_fetch_error(state['article_text']):
+            logger.info("Sentiment skipped: article could not be fetched")
+            return {}
+        if quick_name_check(state['applicant_name'], state['article_text'])[0] == "none":
+            logger.info("Sentiment skipped: name not found in article (skipping LLM call)")
+            return {"skipped_calls": 1}
+
+    if SENTIMENT_KEYWORD_SHORTCUT:
+        negative_terms = find_negative_terms(state['article_text'])
+        if len(negative_terms) >= 2:
+            logger.info(f"Sentiment: red-flag terms {negative_terms} found (skipping LLM call)")
+            return {
+                "sentiment": "Negative",
+                "sentiment_explanation": f"Red-flag terms found in article: {', '.join(negative_terms)}. LLM call skipped for efficiency.",
+                "skipped_calls": 1
+            }
+
+    article_context = state.get('article_context', '')
+    prompt = format_article_prompt(
+        SENTIMENT_ANALYSIS_PROMPT,
+        state['article_text'],
+        article_context,
+        applicant_name=state['applicant_name']
     )
 
     try:
-        response_text, usage_metadata = call_llm_with_retry(prompt)
-        cleaned_response = response_text.strip().lstrip('```json').rstrip('```').strip()
-        data = json.loads(cleaned_response)
-
-        # Update token usage tracking
-        token_usage = state.get('token_usage', {})
-        token_usage['assess_sentiment'] = usage_metadata
+        response_text, usage_metadata = call_llm_cached(
+            prompt, 'assess_sentiment', article_cache,
+            generation_config=SENTIMENT_ANALYSIS_CONFIG, cached_content=article_context or None
+        )
+        data = loads_json(response_text)
 
         return {
             "sentiment": data.get("sentiment", "Neutral"),
             "sentiment_explanation": data.get("explanation", "Error in parsing response."),
-            "token_usage": token_usage
+            **track_llm_usage('assess_sentiment', usage_metadata)
         }
     except Exception as e:
         logger.error(f"Error in assess_sentiment_node: {e}", exc_info=True)
@@ -336,3 +711,82 @@ def assess_sentiment_node(state: GraphState) -> dict:
             "sentiment": "Neutral",
             "sentiment_explanation": f"LLM call or JSON parsing failed: {e}. Defaulting to Neutral."
         }
+
+
+def combined_analysis_node(state: GraphState, article_cache: Optional[dict] = None) -> dict:
+    """
+    Node (single LLM call, COMBINED_LLM_ANALYSIS=1): Answers name presence, age, identity and
+    sentiment in one structured-JSON call instead of the four per-node calls.
+
+    The quick name check still short-circuits to Non-Match without calling the LLM, and the
+    answer is resolved with the same rules as the routers of the per-node workflow:
+    no name -> Non-Match, age mismatch -> Age Mismatch - Needs Verification, and sentiment
+    is only kept for Match / Review Required.
+
+    Args:
+        state: Current graph state
+        article_cache: Optional shared LLM response cache
+
+    Returns:
+        Updated state with every name, age, match and sentiment field
+    """
+    logger.info("Node: Combined Analysis")
+
+    confidence_level, name_found = quick_name_check(state['applicant_name'], state['article_text'])
+    if confidence_level == "none":
+        logger.info(f"✗ Quick name check: NO match found for '{state['applicant_name']}' (skipping LLM call)")
+        explanation = f"No match: '{state['applicant_name']}' or significant name parts not found in article. LLM call skipped for efficiency."
+        return {
+            "name_is_present": False,
+            "name_check_explanation": explanation,
+            "match_decision": "Non-Match",
+            "match_explanation": explanation,
+            "skipped_calls": 1,
+            "name_check_skipped": True
+        }
+
+    prompt = format_article_prompt(
+        COMBINED_ANALYSIS_PROMPT,
+        state['article_text'],
+        '',
+        applicant_name=state['applicant_name'],
+        applicant_dob=state['applicant_dob']
+    )
+
+    try:
+        response_text, usage_metadata = call_llm_cached(
+            prompt, 'combined_analysis', article_cache, generation_config=COMBINED_ANALYSIS_CONFIG
+        )
+        data = loads_json(response_text)
+    except Exception as e:
+        logger.error(f"Error in combined_analysis_node: {e}", exc_info=True)
+        return {
+            "name_is_present": confidence_level == "exact",
+            "match_decision": "Review Required",
+            "match_explanation": f"LLM call or JSON parsing failed: {e}. Manual review needed."
+        }
+
+    # An exact regex match is trusted over the LLM, as in check_name_presence_node
+    name_is_present = confidence_level == "exact" or data.get("name_is_present", False)
+    updates = {
+        "name_is_present": name_is_present,
+        "name_check_explanation": data.get("name_check_explanation", "Error in parsing response."),
+        "age_matches": data.get("age_matches", True),
+        "age_check_explanation": data.get("age_check_explanation", "Error in parsing response."),
+        **track_llm_usage('combined_analysis', usage_metadata)
+    }
+
+    if not name_is_present:
+        updates["match_decision"] = "Non-Match"
+        updates["match_explanation"] = updates["name_check_explanation"]
+    elif not updates["age_matches"]:
+        updates["match_decision"] = "Age Mismatch - Needs Verification"
+        updates["match_explanation"] = updates["age_check_explanation"]
+    else:
+        updates["match_decision"] = data.get("decision", "Review Required")
+        updates["match_explanation"] = data.get("explanation", "Error in parsing response.")
+        if updates["match_decision"] != "Non-Match":
+            updates["sentiment"] = data.get("sentiment", "Neutral")
+            updates["sentiment_explanation"] = data.get("sentiment_explanation", "Error in parsing response.")
+
+    return updates
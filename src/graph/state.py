@@ -2,7 +2,13 @@
 State definition for the LangGraph workflow.
 """
 
-from typing import TypedDict, Literal, Dict
+import operator
+from typing import TypedDict, Literal, Dict, Annotated
+
+
+def merge_token_usage(left: Dict[str, Dict[str, int]], right: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+    """Reducer for token_usage: adds the entries of a node's update to the run's usage."""
+    return {**left, **right}
 
 
 class GraphState(TypedDict):
@@ -19,5 +25,30 @@ class GraphState(TypedDict):
     match_explanation: str
     sentiment: Literal["Positive", "Negative", "Neutral", "N/A"]
     sentiment_explanation: str
-    # Token usage tracking
-    token_usage: Dict[str, Dict[str, int]]  # {"node_name": {"prompt_tokens": X, "completion_tokens": Y, "total_tokens": Z}}
+    # Token usage tracking. Nodes return only their own entry / count; the reducers accumulate them,
+    # which also lets parallel branches update these fields in the same step.
+    token_usage: Annotated[Dict[str, Dict[str, int]], merge_token_usage]  # {"node_name": {"prompt_tokens": X, "completion_tokens": Y, "total_tokens": Z}}
+    total_tokens: Annotated[int, operator.add]  # Running sum of total_tokens across all LLM calls in the run
+    skipped_calls: Annotated[int, operator.add]  # LLM calls avoided by the quick name check or the response cache
+    name_check_skipped: bool  # The quick name check found no name parts, so the name was never sent to the LLM
+    article_context: str  # Name of the Gemini context cache holding article_text ("" when not cached)
+
+
+# Default values for every non-input field, shared by all runs.
+# Nodes never mutate these values (token_usage is merged into a new dict), so sharing is safe.
+INITIAL_STATE_DEFAULTS = {
+    "article_text": "",
+    "name_is_present": False,
+    "name_check_explanation": "",
+    "age_matches": False,
+    "age_check_explanation": "",
+    "match_decision": "Review Required",
+    "match_explanation": "",
+    "sentiment": "N/A",
+    "sentiment_explanation": "",
+    "token_usage": {},
+    "total_tokens": 0,
+    "skipped_calls": 0,
+    "name_check_skipped": False,
+    "article_context": "",
+}
@@ -2,7 +2,12 @@
 LangGraph workflow assembly and compilation.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Optional
 from langgraph.graph import StateGraph, END
+from src.config import COMBINED_LLM_ANALYSIS, PARALLEL_SENTIMENT
 from .state import GraphState
 from .nodes import (
     fetch_article_node,
@@ -11,17 +16,20 @@ from .nodes import (
     set_age_mismatch_node,
     verify_details_node,
     set_name_non_match_node,
-    assess_sentiment_node
+    assess_sentiment_node,
+    combined_analysis_node
 )
-from .edges import should_verify_age, should_verify_details, should_assess_sentiment
+from .edges import should_analyze_article, should_verify_age, should_verify_details, should_assess_sentiment
 
 
-def build_graph():
+def build_graph(article_cache: Optional[dict] = None, combined_analysis: bool = COMBINED_LLM_ANALYSIS,
+                parallel_sentiment: bool = PARALLEL_SENTIMENT):
     """
     Builds and compiles the LangGraph workflow.
 
     Workflow:
     1. Fetch article
+       - If it cannot be fetched: End with Review Required
     2. Check if name is present
        - If NO: End with Non-Match
        - If YES: Continue to age verification
@@ -33,25 +41,61 @@ def build_graph():
        - If Match/Review Required: Continue to sentiment
     5. Assess sentiment
 
+    With combined_analysis, steps 2-5 are a single combined_analysis node (one LLM call).
+    With parallel_sentiment, step 5 starts right after step 1, alongside the name check, and its
+    result is cleared if the case ends without a Match / Review Required decision.
+
+    Args:
+        article_cache: Optional dict shared across runs of the compiled graph. When given,
+            fetched articles and LLM responses are memoized by content hash so repeated
+            articles skip the fetch and any identical LLM call.
+        combined_analysis: Use the single-call workflow (defaults to COMBINED_LLM_ANALYSIS)
+        parallel_sentiment: Run sentiment concurrently with the checks (defaults to PARALLEL_SENTIMENT)
+
     Returns:
         Compiled workflow graph
     """
     workflow = StateGraph(GraphState)
 
     # Add nodes
-    workflow.add_node("fetch_article", fetch_article_node)
-    workflow.add_node("check_name_presence", check_name_presence_node)
-    workflow.add_node("verify_age", verify_age_node)
+    workflow.add_node("fetch_article", partial(fetch_article_node, article_cache=article_cache))
+
+    if combined_analysis:
+        workflow.add_node("combined_analysis", partial(combined_analysis_node, article_cache=article_cache))
+        workflow.set_entry_point("fetch_article")
+        workflow.add_conditional_edges(
+            "fetch_article",
+            should_analyze_article,
+            {
+                "analyze": "combined_analysis",
+                "end": END
+            }
+        )
+        workflow.add_edge("combined_analysis", END)
+        return workflow.compile()
+
+    workflow.add_node("check_name_presence", partial(check_name_presence_node, article_cache=article_cache))
+    workflow.add_node("verify_age", partial(verify_age_node, article_cache=article_cache))
     workflow.add_node("set_age_mismatch", set_age_mismatch_node)
-    workflow.add_node("verify_details", verify_details_node)
+    workflow.add_node("verify_details", partial(verify_details_node, article_cache=article_cache))
     workflow.add_node("set_name_non_match", set_name_non_match_node)
-    workflow.add_node("assess_sentiment", assess_sentiment_node)
+    workflow.add_node(
+        "assess_sentiment",
+        partial(assess_sentiment_node, article_cache=article_cache, skip_without_name=parallel_sentiment)
+    )
 
     # Set entry point
     workflow.set_entry_point("fetch_article")
 
-    # Add edges
-    workflow.add_edge("fetch_article", "check_name_presence")
+    # Router 0: After fetching -> check the name or end on a fetch error
+    workflow.add_conditional_edges(
+        "fetch_article",
+        should_analyze_article,
+        {
+            "analyze": "check_name_presence",
+            "end": END
+        }
+    )
 
     # Router 1: After name check -> verify age or end
     workflow.add_conditional_edges(
@@ -77,16 +121,51 @@ def build_graph():
 
     workflow.add_edge("set_age_mismatch", END)
 
-    # Router 3: After detail verification -> assess sentiment or end
-    workflow.add_conditional_edges(
-        "verify_details",
-        should_assess_sentiment,
-        {
-            "assess_sentiment": "assess_sentiment",
-            "end": END
-        }
-    )
+    if parallel_sentiment:
+        # Sentiment only needs the article, so its LLM call overlaps with the checks
+        # (LangGraph runs both branches of a step concurrently)
+        workflow.add_edge("fetch_article", "assess_sentiment")
+        workflow.add_edge("verify_details", END)
+    else:
+        # Router 3: After detail verification -> assess sentiment or end
+        workflow.add_conditional_edges(
+            "verify_details",
+            should_assess_sentiment,
+            {
+                "assess_sentiment": "assess_sentiment",
+                "end": END
+            }
+        )
 
     workflow.add_edge("assess_sentiment", END)
 
     return workflow.compile()
+
+
+@lru_cache(maxsize=1)
+def get_app():
+    """
+    Return the compiled workflow without a shared cache, compiling it only once per process.
+
+    Use build_graph directly when a run needs its own article_cache.
+
+    Returns:
+        Compiled workflow graph
+    """
+    return build_graph()
+
+
+def size_node_executor(concurrency: int) -> None:
+    """
+    Give the running event loop a default executor large enough for `concurrency` cases.
+
+    The nodes are synchronous, so app.astream runs each of them in the loop's default
+    executor, whose size is capped by the CPU count (5 threads on a single core). Each case
+    holds a thread while its LLM call is in flight, plus one for a parallel sentiment branch
+    and the asyncio.to_thread tracking calls. Call from inside the loop before the cases start.
+
+    Args:
+        concurrency: Maximum number of cases processed at the same time
+    """
+    executor = ThreadPoolExecutor(max_workers=2 * concurrency + 4, thread_name_prefix="graph-node")
+    asyncio.get_running_loop().set_default_executor(executor)
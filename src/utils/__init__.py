@@ -1,13 +1,31 @@
 """Utilities package for Article Person Verification."""
 
-from .web_scraper import fetch_article_text, quick_name_check
-from .file_loader import load_test_cases
+from .web_scraper import fetch_article_text, is_fetch_error, focus_article_text, cap_article_text, quick_name_check, find_negative_terms
+from .file_loader import load_test_cases, load_watchlist
 from .logger import setup_logger, get_logger
+from .serialization import dumps_json, loads_json
+from .mlflow_queue import MlflowLoggingQueue
+from .rate_limiter import AsyncRateLimiter
+from .llm_cache import LLMResponseCache
+from .article_cache import ArticleCache
+from .watchlist import NameWatchlist
 
 __all__ = [
     'fetch_article_text',
+    'is_fetch_error',
+    'focus_article_text',
+    'cap_article_text',
     'quick_name_check',
+    'find_negative_terms',
     'load_test_cases',
+    'load_watchlist',
     'setup_logger',
-    'get_logger'
+    'get_logger',
+    'dumps_json',
+    'loads_json',
+    'MlflowLoggingQueue',
+    'AsyncRateLimiter',
+    'LLMResponseCache',
+    'ArticleCache',
+    'NameWatchlist'
 ]
@@ -0,0 +1,62 @@
+"""
+Persistent on-disk cache for fetched article text.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+
+class ArticleCache:
+    """
+    SQLite cache of the cleaned text of fetched article URLs, with the HTTP validators
+    (ETag, Last-Modified) of the response it came from.
+
+    Reruns send the validators as a conditional GET; when the site answers 304 Not Modified
+    the stored text is reused without downloading or parsing the page again. Safe to share
+    between the threads LangGraph runs nodes on.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS articles (url TEXT PRIMARY KEY, text TEXT NOT NULL, "
+            "etag TEXT NOT NULL, last_modified TEXT NOT NULL, fetched REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Look up the stored text of a URL.
+
+        Args:
+            url: URL of the article
+
+        Returns:
+            (text, etag, last_modified) with empty strings for missing validators, or None if the URL is not cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, etag, last_modified FROM articles WHERE url = ?", (url,)
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def set(self, url: str, text: str, etag: str = "", last_modified: str = "") -> None:
+        """
+        Store the text of a URL, replacing any previous entry.
+
+        Args:
+            url: URL of the article
+            text: Cleaned article text
+            etag: ETag header of the response ("" if absent)
+            last_modified: Last-Modified header of the response ("" if absent)
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO articles (url, text, etag, last_modified, fetched) VALUES (?, ?, ?, ?, ?)",
+                (url, text, etag, last_modified, time.time())
+            )
+            self._conn.commit()
@@ -3,12 +3,49 @@ File loading utilities for test cases and CSV files.
 """
 
 import csv
-from typing import List, Dict
+from typing import Dict, Iterator, List
+from .logger import get_logger
 
+logger = get_logger("ArticleVerification.FileLoader")
 
-def load_test_cases(file_path: str) -> List[Dict[str, str]]:
+# Keys every test case needs after normalization
+REQUIRED_CASE_KEYS = ('name', 'dob', 'url')
+
+
+class CaseFileReader:
+    """
+    Test cases of a CSV file, read one row at a time as they are iterated.
+
+    skipped_rows counts the invalid rows dropped so far, so callers can report them
+    once iteration has finished.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.skipped_rows = 0
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        self.skipped_rows = 0
+        try:
+            with open(self.file_path, mode='r', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                for row in reader:
+                    # Normalize: if 'text' column exists and has content, use it as 'url'
+                    # This allows the rest of the system to work without changes
+                    if 'text' in row and row['text'].strip():
+                        row['url'] = row['text']
+                    if not all(key in row for key in REQUIRED_CASE_KEYS):
+                        logger.warning("Skipping invalid case on line %d: %s", reader.line_num, row)
+                        self.skipped_rows += 1
+                        continue
+                    yield row
+        except FileNotFoundError:
+            logger.error("Test file not found at %s", self.file_path)
+
+
+def load_test_cases(file_path: str) -> CaseFileReader:
     """
-    Loads test cases from a CSV file.
+    Lazily loads test cases from a CSV file, one row at a time.
 
     CSV can have either:
     - name, dob, url (where url is a URL to fetch)
@@ -18,20 +55,38 @@ def load_test_cases(file_path: str) -> List[Dict[str, str]]:
     Args:
         file_path: Path to the CSV file containing test cases
 
+    Rows missing any of name, dob or url (after text normalization) are skipped
+    with a warning and counted in the result's skipped_rows, so callers only receive
+    valid cases. The file is read as the result is iterated, so processing can start
+    before a large file is read.
+
+    Returns:
+        An iterable of dictionaries, each representing a valid test case
+    """
+    return CaseFileReader(file_path)
+
+
+def load_watchlist(file_path: str) -> List[Dict[str, str]]:
+    """
+    Loads a watchlist of applicants (name, dob columns) from a CSV file.
+
+    Args:
+        file_path: Path to the CSV file containing the applicants
+
+    Rows without a name or dob are skipped with a warning.
+
     Returns:
-        List of dictionaries, each representing a test case
+        List of dictionaries with 'name' and 'dob' keys
     """
+    applicants = []
     try:
         with open(file_path, mode='r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
-            cases = []
             for row in reader:
-                # Normalize: if 'text' column exists and has content, use it as 'url'
-                # This allows the rest of the system to work without changes
-                if 'text' in row and row['text'].strip():
-                    row['url'] = row['text']
-                cases.append(row)
-            return cases
+                if not (row.get('name') or '').strip() or not (row.get('dob') or '').strip():
+                    logger.warning("Skipping invalid applicant on line %d: %s", reader.line_num, row)
+                    continue
+                applicants.append({'name': row['name'].strip(), 'dob': row['dob'].strip()})
     except FileNotFoundError:
-        print(f"Error: Test file not found at {file_path}")
-        return []
+        logger.error("Watchlist file not found at %s", file_path)
+    return applicants
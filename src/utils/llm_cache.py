@@ -0,0 +1,84 @@
+"""
+Persistent on-disk cache for LLM responses.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+class LLMResponseCache:
+    """
+    Content-addressed SQLite cache of LLM response texts that survives between runs.
+
+    Reruns over the same test cases or dataset rows answer identical prompts from disk
+    instead of calling the API again. Entries older than ttl_seconds are ignored and
+    overwritten. Safe to share between the threads LangGraph runs nodes on.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 7 * 24 * 3600):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        Build a cache key from the values that determine a response (model name, prompt, ...).
+
+        Args:
+            *parts: Strings identifying the request
+
+        Returns:
+            SHA-256 hex digest of the parts
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            The response text, or None if it is missing or expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ? AND created >= ?",
+                (key, time.time() - self.ttl_seconds)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, response: str) -> None:
+        """
+        Store a response, replacing any previous entry for the key.
+
+        Args:
+            key: Key from make_key
+            response: Response text to cache
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created) VALUES (?, ?, ?)",
+                (key, response, time.time())
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Delete every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
@@ -3,8 +3,12 @@ Logging configuration for the Article Person Verification system.
 Provides structured logging to both console and file.
 """
 
+import atexit
 import logging
 import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from pathlib import Path
 
@@ -12,6 +16,7 @@ from pathlib import Path
 def setup_logger(name: str = "ArticleVerification", log_level: str = "INFO") -> logging.Logger:
     """
     Sets up and configures the logger for the application.
+    Console and file output is written by a background QueueListener thread.
 
     Args:
         name: Logger name
@@ -43,6 +48,12 @@ def setup_logger(name: str = "ArticleVerification", log_level: str = "INFO") ->
         datefmt='%H:%M:%S'
     )
 
+    # Console streams default to the platform encoding (e.g. cp1252 on Windows); switch them to UTF-8
+    # once so names and explanations in any script can be logged without per-call fallbacks
+    for stream in (sys.stdout, sys.stderr):
+        if hasattr(stream, "reconfigure"):
+            stream.reconfigure(encoding="utf-8", errors="replace")
+
     # Console handler (INFO and above)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
@@ -60,10 +71,13 @@ def setup_logger(name: str = "ArticleVerification", log_level: str = "INFO") ->
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(detailed_formatter)
 
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    logger.addHandler(error_handler)
+    # Records are handed to a background listener thread that does the formatting and the
+    # console/file writes, so logging calls never block the event loop or the node threads
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, console_handler, file_handler, error_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flushes the queued records on exit
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
@@ -0,0 +1,54 @@
+"""
+Background queue for MLflow tracking calls.
+"""
+
+import queue
+import threading
+from typing import Callable
+
+from .logger import get_logger
+
+logger = get_logger("ArticleVerification.MlflowQueue")
+
+
+class MlflowLoggingQueue:
+    """
+    Runs MLflow tracking calls on a background thread so callers do not wait on the tracking server.
+
+    Calls are executed one at a time in submission order, so a run's batch is always
+    logged before the same run is terminated. Call flush() before the process exits.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> None:
+        """
+        Queue a tracking call, starting the worker thread on first use.
+
+        Args:
+            fn: Tracking function to call (e.g. MlflowClient.log_batch)
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="mlflow-logging", daemon=True)
+                self._worker.start()
+        self._queue.put((fn, args, kwargs))
+
+    def flush(self) -> None:
+        """Block until every queued call has been executed."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            fn, args, kwargs = self._queue.get()
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Background MLflow call {getattr(fn, '__name__', fn)} failed: {e}", exc_info=True)
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,36 @@
+"""
+Asyncio rate limiter for spacing out API-bound work.
+"""
+
+import asyncio
+import time
+from collections import deque
+
+
+class AsyncRateLimiter:
+    """
+    Sliding-window limiter that allows at most `calls` acquisitions per `period` seconds.
+
+    Unlike a fixed sleep after every case, idle capacity is never wasted: a case
+    starts immediately whenever the window has room. A `calls` of 0 or less disables the limit.
+    """
+
+    def __init__(self, calls: int, period: float = 60.0):
+        self.calls = calls
+        self.period = period
+        self._starts = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until another call fits in the window, then record it."""
+        if self.calls <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._starts and now - self._starts[0] >= self.period:
+                    self._starts.popleft()
+                if len(self._starts) < self.calls:
+                    self._starts.append(now)
+                    return
+                await asyncio.sleep(self.period - (now - self._starts[0]))
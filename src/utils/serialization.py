@@ -0,0 +1,52 @@
+"""
+JSON serialization helpers for MLflow artifacts and LLM responses.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(data) -> str:
+    """
+    Serializes data to an indented JSON string for artifact logging.
+
+    Uses orjson when it is installed, which is several times faster than the
+    standard library on large state dicts (long article_text values).
+    Falls back to json otherwise. Values that are not JSON types are
+    converted with str() in both cases.
+
+    Args:
+        data: JSON-compatible object (typically a state or summary dict)
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode("utf-8")
+    return json.dumps(data, indent=2, default=str)
+
+
+def loads_json(text: str):
+    """
+    Parses a JSON string (e.g. an LLM response), using orjson when it is installed.
+
+    Args:
+        text: JSON document
+
+    Returns:
+        The parsed object
+
+    Raises:
+        ValueError: If text is not valid JSON (json.JSONDecodeError, which orjson's error subclasses)
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
@@ -0,0 +1,82 @@
+"""
+Screening one article against a watchlist of many applicants.
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List
+from .web_scraper import NAME_PART_SEPARATORS, NICKNAMES, NON_LATIN_SCRIPT_RE, normalize_for_matching
+
+# Words of normalized article text; apostrophes are kept so names like "o'neil" stay one word
+WORD_RE = re.compile(r"[\w']+")
+
+# Possessive endings ("smith's", "jones'") removed from words before the name-part lookup
+POSSESSIVE_RE = re.compile(r"'s?$")
+
+
+class NameWatchlist:
+    """
+    Index of applicant name parts that finds, in a single pass over an article, which
+    applicants could be mentioned in it.
+
+    Only the returned applicants need to go through the verification graph. The test
+    mirrors the "partial" level of quick_name_check at word granularity: an applicant
+    is a candidate when at least two significant name parts (all parts for one-part
+    names) or a nickname of the given name plus the surname occur as whole words
+    (possessive endings stripped). Unlike quick_name_check, which also finds name parts
+    inside longer words, inflected forms such as "Müllers" do not count. Articles
+    in a non-Latin script return every applicant with a Latin-script name, since the
+    name may be transliterated.
+    """
+
+    def __init__(self, applicants: Iterable[Dict[str, str]]):
+        """
+        Args:
+            applicants: Dictionaries with at least a 'name' key (e.g. name, dob rows of a CSV)
+        """
+        self.applicants = [applicant for applicant in applicants if applicant.get('name', '').strip()]
+        self._required = []
+        # word -> (applicant index, name part it stands for)
+        self._index = defaultdict(set)
+
+        for idx, applicant in enumerate(self.applicants):
+            parts = [normalize_for_matching(part) for part in NAME_PART_SEPARATORS.split(applicant['name']) if part.strip()]
+            significant = [part for part in parts if len(part) >= 3] or parts
+            for part in set(significant):
+                self._index[part].add((idx, part))
+            # A nickname counts as the given name, so "jim" + "smith" reaches two parts for James Smith
+            if len(parts) >= 2 and parts[0] in significant:
+                for nickname in NICKNAMES.get(parts[0], ()):
+                    self._index[nickname].add((idx, parts[0]))
+            self._required.append(min(2, len(set(significant))))
+
+    def __len__(self) -> int:
+        return len(self.applicants)
+
+    def scan(self, article_text: str) -> List[Dict[str, str]]:
+        """
+        Finds the applicants that may be mentioned in an article.
+
+        Args:
+            article_text: The article text to scan
+
+        Returns:
+            The candidate applicants, in watchlist order
+        """
+        if NON_LATIN_SCRIPT_RE.search(article_text):
+            transliterable = {idx for idx, applicant in enumerate(self.applicants) if normalize_for_matching(applicant['name']).isascii()}
+        else:
+            transliterable = set()
+
+        words = set(WORD_RE.findall(normalize_for_matching(article_text)))
+        words |= {POSSESSIVE_RE.sub('', word) for word in words if "'" in word}
+
+        parts_found = defaultdict(set)
+        for word in words:
+            for idx, part in self._index.get(word, ()):
+                parts_found[idx].add(part)
+
+        return [
+            applicant for idx, applicant in enumerate(self.applicants)
+            if idx in transliterable or len(parts_found[idx]) >= self._required[idx]
+        ]
@@ -2,10 +2,123 @@
 Web scraping utilities for fetching and extracting article text.
 """
 
+import codecs
+import html as html_lib
 import re
+import threading
+import unicodedata
+from functools import lru_cache
+from typing import Optional, Tuple
 import requests
 from bs4 import BeautifulSoup
-from src.config import REQUEST_HEADERS, REQUEST_TIMEOUT
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from .article_cache import ArticleCache
+from .logger import get_logger
+from src.config import REQUEST_HEADERS, REQUEST_TIMEOUT, MAX_PAGE_BYTES, URL_CACHE_SIZE, ARTICLE_CACHE, NEGATIVE_SENTIMENT_TERMS
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+logger = get_logger("ArticleVerification.WebScraper")
+
+# fetch_article_text returns the error message, starting with this prefix, instead of raising
+FETCH_ERROR_PREFIX = "Error: Could not fetch article."
+
+# Content-Type fragments of responses that can hold article text (HTML, XHTML, plain text, XML feeds)
+TEXT_CONTENT_TYPES = ('html', 'text/', 'xml')
+
+# Case-insensitive prefixes that mark an input as a URL rather than article text
+URL_PREFIXES = ('http://', 'https://', 'www.')
+
+# Separators between the parts of a person's name (spaces, hyphens, commas, periods)
+NAME_PART_SEPARATORS = re.compile(r'[\s\-,.]')
+
+# Shared session so concurrent cases reuse pooled TCP/TLS connections instead of opening one per article.
+# Transient server errors and 429s are retried with a short backoff.
+# Accept-Encoding is left to requests: gzip/deflate, plus br/zstd when brotli/zstandard are installed.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers.update(REQUEST_HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+)
+HTTP_SESSION.mount('https://', _adapter)
+HTTP_SESSION.mount('http://', _adapter)
+
+# Article text persisted between runs and revalidated with conditional GETs (ARTICLE_CACHE)
+article_cache = ArticleCache(ARTICLE_CACHE) if ARTICLE_CACHE else None
+
+# One lock per URL so concurrent cases citing the same article fetch it only once
+_url_locks = {}
+_url_locks_guard = threading.Lock()
+
+# Page furniture whose paragraphs (menus, cookie banners, related links, newsletter boxes) are not article text
+BOILERPLATE_TAGS = ['nav', 'footer', 'aside']
+
+# Paragraph extraction without building a DOM: comments, script/style blocks and boilerplate
+# containers are dropped first, then the inner HTML of each <p> element is stripped of tags
+NON_CONTENT_RE = re.compile(
+    r'<!--.*?-->|<(script|style|' + '|'.join(BOILERPLATE_TAGS) + r')\b[^>]*>.*?</\1\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+# Block-level elements whose start or end tag implicitly closes an open <p> (HTML omits </p> freely)
+PARAGRAPH_CLOSING_BLOCKS = (
+    'address|article|aside|blockquote|body|div|dl|fieldset|figure|footer|form|h[1-6]|header'
+    '|hr|html|li|main|nav|ol|pre|section|table|td|th|ul'
+)
+# A paragraph ends at </p>, the next <p>, a block-level tag, or the end of the page. Written as
+# runs of non-"<" text joined by tags that do not end it, which scans faster than a lazy .*?
+PARAGRAPH_RE = re.compile(
+    r'<p(?:\s[^>]*)?>([^<]*(?:<(?!/?p[\s>]|/?(?:' + PARAGRAPH_CLOSING_BLOCKS + r')\b)[^<]*)*)',
+    re.IGNORECASE
+)
+TAG_RE = re.compile(r'<[^>]+>')
+
+# Letters of scripts a Latin-script name may be transliterated into (Greek, Cyrillic, Hebrew, Arabic,
+# Indic, Thai, kana, CJK, Hangul). Such articles can mention the applicant without any Latin name part.
+NON_LATIN_SCRIPT_RE = re.compile(
+    r'[\u0370-\u03ff\u0400-\u052f\u0590-\u06ff\u0900-\u0dff\u0e00-\u0e7f\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af]'
+)
+
+# Common English short forms of given names, used as deterministic name variants
+NICKNAMES = {
+    "alexander": ("alex",),
+    "andrew": ("andy", "drew"),
+    "anthony": ("tony",),
+    "benjamin": ("ben",),
+    "catherine": ("cathy", "kate", "katie"),
+    "charles": ("charlie", "chuck"),
+    "christopher": ("chris",),
+    "daniel": ("dan", "danny"),
+    "david": ("dave",),
+    "edward": ("ed", "eddie", "ted"),
+    "elizabeth": ("liz", "beth", "betty"),
+    "james": ("jim", "jimmy", "jamie"),
+    "jennifer": ("jen", "jenny"),
+    "john": ("jack", "johnny"),
+    "jonathan": ("jon",),
+    "joseph": ("joe", "joey"),
+    "katherine": ("kathy", "kate", "katie"),
+    "margaret": ("maggie", "peggy", "meg"),
+    "matthew": ("matt",),
+    "michael": ("mike", "mick"),
+    "nicholas": ("nick",),
+    "patricia": ("pat", "patty", "trish"),
+    "patrick": ("pat", "paddy"),
+    "richard": ("rick", "rich", "dick"),
+    "robert": ("rob", "bob", "bobby", "bert"),
+    "samuel": ("sam",),
+    "stephen": ("steve",),
+    "steven": ("steve",),
+    "susan": ("sue", "susie"),
+    "thomas": ("tom", "tommy"),
+    "timothy": ("tim",),
+    "william": ("will", "bill", "billy", "liam"),
+}
 
 
 def is_url(text: str) -> bool:
@@ -18,8 +131,146 @@ def is_url(text: str) -> bool:
     Returns:
         True if text appears to be a URL, False otherwise
     """
-    url_indicators = ['http://', 'https://', 'www.']
-    return any(text.strip().lower().startswith(indicator) for indicator in url_indicators)
+    # Only the first few characters are lowercased; the input may be a whole article
+    return text.lstrip()[:8].lower().startswith(URL_PREFIXES)
+
+
+def extract_article_text(html: str) -> str:
+    """
+    Extracts the paragraph text of an HTML page, or all of its text if it has no paragraphs.
+    Paragraphs inside navigation, footer and aside elements are skipped.
+
+    Uses selectolax (the C Lexbor parser) when it is installed, which parses several
+    times faster than BeautifulSoup's pure-Python html.parser. Otherwise paragraphs are
+    extracted with compiled regexes, and BeautifulSoup is only used for pages without
+    <p> elements.
+
+    Args:
+        html: HTML source of the page
+
+    Returns:
+        Raw extracted text (not yet cleaned up)
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(BOILERPLATE_TAGS)
+        article_text = "\n".join([p.text() for p in tree.css('p')])
+        if not article_text.strip() and tree.root is not None:
+            article_text = tree.root.text()
+        return article_text
+
+    # Try to extract paragraph text first
+    content = NON_CONTENT_RE.sub('', html)
+    article_text = "\n".join([html_lib.unescape(TAG_RE.sub('', p)) for p in PARAGRAPH_RE.findall(content)])
+
+    # Fallback to all text if no paragraphs found
+    if not article_text.strip():
+        article_text = BeautifulSoup(html, 'html.parser').get_text()
+    return article_text
+
+
+def _url_lock(url: str) -> threading.Lock:
+    """Return the lock that serializes the first fetch of a URL."""
+    with _url_locks_guard:
+        return _url_locks.setdefault(url, threading.Lock())
+
+
+def _download_url_text(url: str, cached: Optional[Tuple[str, str, str]] = None) -> Tuple[Optional[str], str, str]:
+    """
+    Download and extract one URL, revalidating a previously stored copy if given.
+
+    Returns:
+        (article text, ETag, Last-Modified); the text is None when the site answers 304 Not Modified
+    """
+    headers = {}
+    if cached is not None:
+        _, etag, last_modified = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+    # Streamed so oversized pages are cut at MAX_PAGE_BYTES instead of being read into memory whole
+    with HTTP_SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        if response.status_code == 304:
+            return None, '', ''
+        # PDFs, images and other binary responses would reach the LLM as garbage; fail before reading them
+        content_type = response.headers.get('Content-Type', '').lower()
+        if content_type and not any(kind in content_type for kind in TEXT_CONTENT_TYPES):
+            raise requests.exceptions.RequestException(f"Unsupported content type: {content_type}")
+        chunks, size = [], 0
+        for chunk in response.iter_content(chunk_size=65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= MAX_PAGE_BYTES:
+                logger.warning("Page at %s exceeds %d bytes; truncating", url, MAX_PAGE_BYTES)
+                break
+
+    body = b"".join(chunks)[:MAX_PAGE_BYTES]
+    html = None
+    if 'charset' in response.headers.get('Content-Type', '').lower():
+        try:
+            html = body.decode(response.encoding, errors='replace')
+        except LookupError:
+            pass  # Unknown charset name; treat it as undeclared
+    if html is None:
+        # No usable charset: most pages are UTF-8, so try that before the HTTP default
+        # (ISO-8859-1) instead of running slow charset detection over the whole page
+        try:
+            # final=False drops a multi-byte character cut off by the size limit
+            html = codecs.getincrementaldecoder('utf-8')().decode(body, final=False)
+        except UnicodeDecodeError:
+            html = body.decode('iso-8859-1')
+    article_text = extract_article_text(html)
+
+    # Clean up the text
+    article_text = "\n".join([line.strip() for line in article_text.split('\n') if line.strip()])
+    return article_text, response.headers.get('ETag', ''), response.headers.get('Last-Modified', '')
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _fetch_url_text_cached(url: str) -> str:
+    """Download and extract one URL (memoized; exceptions propagate and are not cached)."""
+    if article_cache is None:
+        return _download_url_text(url)[0]
+
+    cached = article_cache.get(url)
+    try:
+        article_text, etag, last_modified = _download_url_text(url, cached)
+    except requests.exceptions.RequestException as e:
+        if cached is None:
+            raise
+        logger.warning("Could not revalidate %s (%s); using the stored text", url, e)
+        return cached[0]
+
+    if article_text is None:
+        logger.debug("Article at %s not modified; using the stored text", url)
+        return cached[0]
+    article_cache.set(url, article_text, etag, last_modified)
+    return article_text
+
+
+def fetch_url_text(url: str) -> str:
+    """
+    Fetches a URL and extracts its cleaned article text, reusing the text of URLs fetched before.
+
+    Up to URL_CACHE_SIZE successfully fetched URLs are kept (failures are not cached).
+    Concurrent first fetches of the same URL wait for each other instead of all
+    downloading it.
+    With ARTICLE_CACHE set, the text is also persisted on disk and revalidated by later runs.
+
+    Args:
+        url: URL of the article
+
+    Returns:
+        Cleaned article text
+
+    Raises:
+        requests.exceptions.RequestException: If the page cannot be fetched
+    """
+    with _url_lock(url):
+        return _fetch_url_text_cached(url)
 
 
 def fetch_article_text(url_or_text: str) -> str:
@@ -34,50 +285,50 @@ def fetch_article_text(url_or_text: str) -> str:
     """
     # Check if input is a URL or direct text
     if not is_url(url_or_text):
-        print("--- Input detected as direct text (not a URL) ---")
+        logger.debug("Input detected as direct text (not a URL)")
         # Return the text as-is (it's already the article content)
         return url_or_text.strip()
 
     # If it's a URL, fetch the content
-    print(f"--- Input detected as URL, fetching content ---")
+    logger.debug("Input detected as URL, fetching content")
     try:
-        if "google.com/search" in url_or_text:
-            print(f"Handling Google search URL: {url_or_text}")
-            pass
-
-        response = requests.get(url_or_text, headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, 'html.parser')
+        return fetch_url_text(url_or_text)
+    except requests.exceptions.RequestException as e:
+        logger.error("Error fetching article at %s: %s", url_or_text, e)
+        return f"{FETCH_ERROR_PREFIX} {e}"
 
-        # Try to extract paragraph text first
-        paragraphs = soup.find_all('p')
-        article_text = "\n".join([p.get_text() for p in paragraphs])
 
-        # Fallback to all text if no paragraphs found
-        if not article_text.strip():
-            article_text = soup.get_text()
+def is_fetch_error(article_text: str) -> bool:
+    """
+    Checks if fetch_article_text returned an error message instead of article text.
 
-        # Clean up the text
-        return "\n".join([line.strip() for line in article_text.split('\n') if line.strip()])
+    Args:
+        article_text: Text returned by fetch_article_text
 
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching article at {url_or_text}: {e}")
-        return f"Error: Could not fetch article. {e}"
+    Returns:
+        True if the article could not be fetched
+    """
+    return article_text.startswith(FETCH_ERROR_PREFIX)
 
 
+@lru_cache(maxsize=256)
 def normalize_for_matching(text: str) -> str:
     """
     Normalize text for better cross-lingual matching by removing accents
     and handling common transliteration variations.
 
+    Results are cached: the same article is normalized by the name check, the
+    sentiment shortcut and the focus window of every case that uses it.
+
     Args:
         text: The text to normalize
 
     Returns:
         Normalized text
     """
-    import unicodedata
+    # ASCII text has nothing to decompose; skip the per-character pass
+    if text.isascii():
+        return text.lower()
 
     # Decompose accented characters and remove accent marks
     # e.g., "José" → "Jose", "María" → "Maria"
@@ -89,6 +340,134 @@ def normalize_for_matching(text: str) -> str:
     return text.lower()
 
 
+@lru_cache(maxsize=1024)
+def name_variant_pattern(name: str):
+    """
+    Builds one compiled pattern matching the deterministic variants of a full name:
+    first and last name without middle names, last name first (optionally with a comma,
+    as in "Smith, James"), and common nicknames of the given name (e.g. "James Robert
+    Smith" → "james smith", "smith james", "smith, james", "jim smith"). Variants only
+    match as whole words.
+
+    Args:
+        name: The full name (e.g., "James Robert Smith")
+
+    Returns:
+        Compiled regex over normalized text, or None if the name has fewer than two parts
+    """
+    parts = [normalize_for_matching(part) for part in NAME_PART_SEPARATORS.split(name) if part.strip()]
+    if len(parts) < 2:
+        return None
+
+    first, last = parts[0], parts[-1]
+    variants = {f"{first} {last}"}
+    variants.update(f"{nickname} {last}" for nickname in NICKNAMES.get(first, ()))
+
+    alternation = "|".join(re.escape(variant) for variant in sorted(variants, key=len, reverse=True))
+    # Surname first, as in bylines, lists and court records ("Smith James", "Smith, James")
+    reordered = rf"{re.escape(last)},?\s+{re.escape(first)}"
+    return re.compile(rf"(?<!\w)(?:{alternation}|{reordered})(?!\w)")
+
+
+def focus_article_text(article_text: str, name: str, window: int, head_chars: int = 2000) -> str:
+    """
+    Trims a long article to the passages around mentions of the name, so LLM prompts
+    carry only the text that can identify the person.
+
+    Keeps the first head_chars characters (headline and lead) plus window characters on
+    each side of every occurrence of a name part, merging overlapping passages. Name parts
+    shorter than 3 characters (initials, particles like "de") are not searched for, as they
+    match almost everywhere. Matching is case- and accent-insensitive. The article is
+    returned unchanged when no searched name part occurs, when trimming would not shorten
+    it, or when normalization changes the text length (so match positions cannot be mapped back).
+
+    Args:
+        article_text: Full article text
+        name: Applicant name whose parts are searched for
+        window: Characters kept before and after each match
+        head_chars: Characters always kept from the start of the article
+
+    Returns:
+        The focused article text, with omitted passages marked by "[...]"
+    """
+    if len(article_text) <= head_chars + 2 * window:
+        return article_text
+
+    article_normalized = normalize_for_matching(article_text)
+    if len(article_normalized) != len(article_text):
+        return article_text
+
+    name_parts = {normalize_for_matching(part) for part in NAME_PART_SEPARATORS.split(name) if len(part.strip()) >= 3}
+    if not name_parts:
+        return article_text
+
+    # One alternation pass over the article for all name parts, longest first
+    pattern = re.compile("|".join(re.escape(part) for part in sorted(name_parts, key=len, reverse=True)))
+
+    spans = [(0, head_chars)]
+    matched = False
+    for match in pattern.finditer(article_normalized):
+        matched = True
+        start, end = max(0, match.start() - window), match.end() + window
+        if start <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+        else:
+            spans.append((start, end))
+
+    if not matched:
+        return article_text
+
+    return "\n[...]\n".join(article_text[start:end] for start, end in spans)
+
+
+# Red-flag terms in the form normalize_for_matching gives them in an article (NFD decomposes Hangul,
+# Arabic hamza and Cyrillic "й"), mapped back to the configured term
+NEGATIVE_TERM_FORMS = {normalize_for_matching(term): term for term in NEGATIVE_SENTIMENT_TERMS}
+
+# One pass over the article for every red-flag term; Latin-script terms must start a word
+NEGATIVE_TERMS_RE = re.compile("|".join(
+    (r'(?<!\w)' + re.escape(form)) if form.isascii() else re.escape(form)
+    for form in sorted(NEGATIVE_TERM_FORMS, key=len, reverse=True)
+))
+
+
+def find_negative_terms(article_text: str) -> list[str]:
+    """
+    Finds the distinct red-flag terms (NEGATIVE_SENTIMENT_TERMS) that occur in an article.
+    Matching is case- and accent-insensitive.
+
+    Args:
+        article_text: The article text to scan
+
+    Returns:
+        The matched terms, in order of first occurrence
+    """
+    found = dict.fromkeys(
+        NEGATIVE_TERM_FORMS[match.group(0)]
+        for match in NEGATIVE_TERMS_RE.finditer(normalize_for_matching(article_text))
+    )
+    return list(found)
+
+
+def cap_article_text(article_text: str, max_chars: int) -> str:
+    """
+    Bounds the article length sent to the LLM, keeping the lead (two thirds of the budget)
+    and the ending (one third), where names, ages and outcomes are usually stated.
+
+    Args:
+        article_text: Article text (possibly already focused)
+        max_chars: Maximum number of characters to keep
+
+    Returns:
+        The article unchanged if it fits, otherwise its start and end joined by "[...]"
+    """
+    if max_chars <= 0 or len(article_text) <= max_chars:
+        return article_text
+
+    head = max_chars * 2 // 3
+    return article_text[:head] + "\n[...]\n" + article_text[-(max_chars - head):]
+
+
 def quick_name_check(name: str, article_text: str) -> tuple[str, bool]:
     """
     Performs a quick keyword-based search to check if a name appears in the article.
@@ -97,7 +476,9 @@ def quick_name_check(name: str, article_text: str) -> tuple[str, bool]:
     Handles:
     - Accented characters (José → Jose)
     - Different word orders (Zhang Wei vs Wei Zhang)
+    - Dropped middle names and common nicknames (Jim Smith for James Robert Smith)
     - Partial name matches
+    - Articles in non-Latin scripts, where a Latin name may appear transliterated
 
     Args:
         name: The full name to search for (e.g., "John Smith")
@@ -105,8 +486,9 @@ def quick_name_check(name: str, article_text: str) -> tuple[str, bool]:
 
     Returns:
         Tuple of (confidence_level, name_found):
-        - ("exact", True): Full name found exactly → Skip LLM, name is present
+        - ("exact", True): Full name or a name variant found → Skip LLM, name is present
         - ("partial", True): Name parts found → Call LLM to verify variations/nicknames
+        - ("script", False): Nothing found, but the article uses a non-Latin script → Call LLM
         - ("none", False): No match found → Skip LLM, name not present
     """
     if not name or not article_text:
@@ -120,9 +502,14 @@ def quick_name_check(name: str, article_text: str) -> tuple[str, bool]:
     if name_normalized in article_normalized:
         return ("exact", True)
 
+    # Strategy 1b: Check name variants (first + last, reversed order, nicknames) in one pass
+    variant_pattern = name_variant_pattern(name)
+    if variant_pattern is not None and variant_pattern.search(article_normalized):
+        return ("exact", True)
+
     # Strategy 2: Split name into parts and check each part
     # This handles cases where first and last names appear separately
-    name_parts = [part.strip() for part in re.split(r'[\s\-,.]', name) if part.strip()]
+    name_parts = [part.strip() for part in NAME_PART_SEPARATORS.split(name) if part.strip()]
     name_parts_normalized = [normalize_for_matching(part) for part in name_parts]
 
     # Filter out very short parts (like middle initials)
@@ -133,7 +520,7 @@ def quick_name_check(name: str, article_text: str) -> tuple[str, bool]:
         significant_parts = name_parts_normalized
 
     # Check if at least 2 name parts appear (or all parts if name has fewer than 2 parts)
-    parts_found = sum(1 for part in significant_parts if part in article_normalized)
+    parts_found = sum(part in article_normalized for part in significant_parts)
 
     # If name has multiple parts, require at least 2 to match
     # If name has only 1 part, require it to match
@@ -141,5 +528,7 @@ def quick_name_check(name: str, article_text: str) -> tuple[str, bool]:
 
     if parts_found >= min_required:
         return ("partial", True)  # Partial match - need LLM to verify variations
+    elif name_normalized.isascii() and NON_LATIN_SCRIPT_RE.search(article_text):
+        return ("script", False)  # Name may be transliterated - need LLM to check
     else:
         return ("none", False)  # No match found
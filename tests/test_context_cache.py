@@ -0,0 +1,48 @@
+"""Tests for uploading the article as a Gemini context cache."""
+
+import os
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+
+from google.generativeai.types import caching_types  # noqa: E402
+from src.graph import nodes  # noqa: E402
+
+LONG_ARTICLE = "John Smith was charged with fraud. " * 400
+
+
+def fake_create(model, contents, ttl):
+    # The SDK converts the TTL before sending the request; invalid types raise TypeError here
+    caching_types.to_optional_ttl(ttl)
+    return SimpleNamespace(name="cachedContents/test", delete=lambda: None)
+
+
+class OpenArticleContextTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(nodes, 'GEMINI_CONTEXT_CACHING', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cache_created_with_configured_ttl(self):
+        with mock.patch.object(nodes.genai.caching.CachedContent, 'create', side_effect=fake_create) as create:
+            update = nodes.open_article_context({'article_text': LONG_ARTICLE})
+        self.assertEqual(update, {'article_context': 'cachedContents/test'})
+        self.assertIs(create.call_args.kwargs['ttl'], nodes.CONTEXT_CACHE_TTL)
+        nodes.release_article_context(update)
+
+    def test_api_error_falls_back_to_inline_article(self):
+        error = nodes.google_exceptions.InvalidArgument("cached content is too small")
+        with mock.patch.object(nodes.genai.caching.CachedContent, 'create', side_effect=error):
+            self.assertEqual(nodes.open_article_context({'article_text': LONG_ARTICLE}), {})
+
+    def test_programming_errors_are_not_swallowed(self):
+        with mock.patch.object(nodes.genai.caching.CachedContent, 'create', side_effect=TypeError("bad ttl")):
+            with self.assertRaises(TypeError):
+                nodes.open_article_context({'article_text': LONG_ARTICLE})
+
+
+if __name__ == '__main__':
+    unittest.main()
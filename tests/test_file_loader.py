@@ -0,0 +1,25 @@
+"""Tests for loading test cases from CSV files."""
+
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+
+from src.utils import load_test_cases  # noqa: E402
+
+
+class LoadTestCasesTest(unittest.TestCase):
+
+    def test_invalid_rows_are_skipped_and_counted(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write("name,dob,text\nJohn Smith,1980-01-01,John Smith was charged.\nJane Doe,1975-05-05,\n")
+        self.addCleanup(os.remove, f.name)
+
+        cases = load_test_cases(f.name)
+        self.assertEqual([case['name'] for case in cases], ['John Smith'])
+        self.assertEqual(cases.skipped_rows, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Tests for the LLM retry and shared rate-limit backoff."""
+
+import os
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+
+from src.graph import nodes  # noqa: E402
+
+RESPONSE = SimpleNamespace(text="{}", usage_metadata=SimpleNamespace(
+    prompt_token_count=1, candidates_token_count=1, total_token_count=2, cached_content_token_count=0
+))
+
+
+class CallLlmWithRetryTest(unittest.TestCase):
+
+    def setUp(self):
+        nodes._rate_limit_until = 0.0
+        self.addCleanup(setattr, nodes, '_rate_limit_until', 0.0)
+        patcher = mock.patch.object(nodes.time, 'sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_error_mentioning_generate_content_is_not_a_rate_limit(self):
+        error = ValueError("Invalid argument passed to generateContent: unsupported field")
+        with mock.patch.object(nodes.model, 'generate_content', side_effect=error):
+            with self.assertRaises(ValueError):
+                nodes.call_llm_with_retry("prompt")
+        self.assertEqual(nodes._rate_limit_until, 0.0)
+        self.sleep.assert_not_called()
+
+    def test_rate_limit_starts_shared_backoff(self):
+        error = nodes.google_exceptions.ResourceExhausted("429 Resource has been exhausted")
+        with mock.patch.object(nodes.model, 'generate_content', side_effect=[error, RESPONSE]):
+            text, _ = nodes.call_llm_with_retry("prompt")
+        self.assertEqual(text, "{}")
+        self.assertGreater(nodes._rate_limit_until, 0.0)
+
+    def test_server_error_backs_off_locally(self):
+        error = nodes.google_exceptions.ServiceUnavailable("503 overloaded")
+        with mock.patch.object(nodes.model, 'generate_content', side_effect=[error, RESPONSE]):
+            nodes.call_llm_with_retry("prompt")
+        self.assertEqual(nodes._rate_limit_until, 0.0)
+        self.sleep.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Tests for the skip flag the name-check nodes record in the graph state."""
+
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+
+from src.graph import get_app, nodes  # noqa: E402
+from src.graph.state import INITIAL_STATE_DEFAULTS  # noqa: E402
+
+
+def make_state(article_text):
+    return {
+        **INITIAL_STATE_DEFAULTS,
+        "applicant_name": "John Smith",
+        "applicant_dob": "1980-01-01",
+        "article_url": article_text,
+        "article_text": article_text,
+    }
+
+
+class NameCheckSkippedTest(unittest.TestCase):
+
+    def test_check_name_presence_records_skip(self):
+        update = nodes.check_name_presence_node(make_state("A bakery opened in town."))
+        self.assertTrue(update["name_check_skipped"])
+
+    def test_combined_analysis_records_skip(self):
+        update = nodes.combined_analysis_node(make_state("A bakery opened in town."))
+        self.assertTrue(update["name_check_skipped"])
+
+    def test_exact_match_is_not_a_skipped_check(self):
+        update = nodes.check_name_presence_node(make_state("John Smith was charged with fraud."))
+        self.assertFalse(update.get("name_check_skipped", False))
+
+    def test_graph_reports_skip_in_final_state(self):
+        final_state = get_app().invoke(make_state("A bakery opened in town."))
+        self.assertTrue(final_state["name_check_skipped"])
+
+    def test_failed_fetch_is_not_a_skipped_check(self):
+        error = "Error: Could not fetch article. 404 Client Error: Not Found"
+        with mock.patch.object(nodes, 'fetch_article_text', return_value=error):
+            final_state = get_app().invoke(make_state("https://example.com/missing"))
+        self.assertEqual(final_state["match_decision"], "Review Required")
+        self.assertFalse(final_state["name_check_skipped"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Tests for the single-pass watchlist screen."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+
+import main  # noqa: E402
+from src.utils import NameWatchlist, quick_name_check  # noqa: E402
+
+
+class NameWatchlistTest(unittest.TestCase):
+
+    def setUp(self):
+        self.watchlist = NameWatchlist([
+            {'name': 'John Smith', 'dob': '1980-01-01'},
+            {'name': "Mary O'Neil", 'dob': '1975-05-05'},
+            {'name': 'Carlos Ruiz', 'dob': '1990-09-09'},
+        ])
+
+    def test_possessive_mention_is_found(self):
+        article = "John Smith's accounts were frozen"
+        self.assertEqual(quick_name_check('John Smith', article)[0], 'exact')
+        self.assertEqual([a['name'] for a in self.watchlist.scan(article)], ['John Smith'])
+
+    def test_apostrophe_names_and_plural_possessives(self):
+        article = "Mary O'Neil's lawyer and the Ruiz' family; Carlos declined to comment."
+        self.assertEqual([a['name'] for a in self.watchlist.scan(article)], ["Mary O'Neil", 'Carlos Ruiz'])
+
+    def test_unrelated_article_has_no_candidates(self):
+        self.assertEqual(self.watchlist.scan("Smithson opened a bakery in town."), [])
+
+
+class WatchlistCasesTest(unittest.TestCase):
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write("name,dob\nJohn Smith,1980-01-01\nCarlos Ruiz,1990-09-09\n")
+        self.addCleanup(os.remove, f.name)
+        self.watchlist_file = f.name
+
+    def test_candidates_become_cases(self):
+        cases = main.watchlist_cases(self.watchlist_file, "John Smith's accounts were frozen.")
+        self.assertEqual([case['name'] for case in cases], ['John Smith'])
+
+    def test_fetch_failure_screens_no_applicants(self):
+        error = "Error: Could not fetch article. 404 Client Error: Not Found"
+        with mock.patch.object(main, 'fetch_article_text', return_value=error):
+            self.assertIsNone(main.watchlist_cases(self.watchlist_file, "https://example.com/missing"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Tests for article text extraction and name matching."""
+
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+
+from src.utils import quick_name_check, web_scraper  # noqa: E402
+
+
+class RegexParagraphExtractionTest(unittest.TestCase):
+    """The extractor used when selectolax is not installed."""
+
+    def setUp(self):
+        patcher = mock.patch.object(web_scraper, 'LexborHTMLParser', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unclosed_paragraphs(self):
+        html = (
+            '<html><body><div class="menu">Home | News | Sport</div>'
+            '<p>First paragraph.<p>Second <b>bold</b> paragraph.<div>Advertisement</div>'
+            '<p class="last">Third paragraph.</body></html>'
+        )
+        self.assertEqual(
+            web_scraper.extract_article_text(html),
+            "First paragraph.\nSecond bold paragraph.\nThird paragraph."
+        )
+
+    def test_closed_paragraphs(self):
+        html = '<p>One &amp; only.</p >\n<pre>code</pre><p>Two<br>lines</P>'
+        self.assertEqual(web_scraper.extract_article_text(html), "One & only.\nTwolines")
+
+
+class QuickNameCheckTest(unittest.TestCase):
+
+    def test_surname_first_with_comma_is_exact(self):
+        self.assertEqual(quick_name_check("James Robert Smith", "Defendants: Smith, James; Doe, Jane.")[0], "exact")
+
+    def test_surname_first_without_comma_is_exact(self):
+        self.assertEqual(quick_name_check("James Smith", "Smith James was questioned.")[0], "exact")
+
+    def test_nickname_is_exact(self):
+        self.assertEqual(quick_name_check("James Smith", "Jim Smith was questioned.")[0], "exact")
+
+    def test_comma_does_not_join_unrelated_names(self):
+        self.assertNotEqual(quick_name_check("James Smith", "Tom Smithers, Jamesville resident")[0], "exact")
+
+
+if __name__ == '__main__':
+    unittest.main()